@@ -638,7 +638,7 @@ _ENV_SECTION_PREFIXES: List[Tuple[str, List[str]]] = [
     ("agent_memory", ["AGENT_"]),
     ("intelligent_memory", ["INTELLIGENT_MEMORY_"]),
     ("memory_decay", ["MEMORY_DECAY_"]),
-    ("performance", ["MEMORY_BATCH_SIZE", "MEMORY_CACHE_SIZE", "MEMORY_CACHE_TTL", "MEMORY_SEARCH_", "VECTOR_STORE_BATCH_SIZE", "VECTOR_STORE_CACHE_SIZE", "VECTOR_STORE_INDEX_REBUILD"]),
+    ("performance", ["MEMORY_BATCH_SIZE", "MEMORY_CACHE_SIZE", "MEMORY_CACHE_TTL", "MEMORY_EMBEDDING_CACHE_", "MEMORY_SEARCH_", "VECTOR_STORE_BATCH_SIZE", "VECTOR_STORE_CACHE_SIZE", "VECTOR_STORE_INDEX_REBUILD"]),
     ("security", ["ENCRYPTION_", "ACCESS_CONTROL_"]),
     ("telemetry", ["TELEMETRY_"]),
     ("audit", ["AUDIT_"]),
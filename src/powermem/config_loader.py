@@ -70,6 +70,11 @@ class TelemetrySettings(_BasePowermemSettings):
         validation_alias=AliasChoices("FLUSH_INTERVAL", "TELEMETRY_FLUSH_INTERVAL"),
         serialization_alias="telemetry_flush_interval",
     )
+    queue_size: int = Field(
+        default=10000,
+        validation_alias=AliasChoices("QUEUE_SIZE", "TELEMETRY_QUEUE_SIZE"),
+        serialization_alias="telemetry_queue_size",
+    )
     retention_days: int = Field(default=30)
 
     def to_config(self) -> Dict[str, Any]:
@@ -81,10 +86,12 @@ class TelemetrySettings(_BasePowermemSettings):
                 "api_key",
                 "batch_size",
                 "flush_interval",
+                "queue_size",
             },
         )
         config["batch_size"] = self.batch_size
         config["flush_interval"] = self.flush_interval
+        config["queue_size"] = self.queue_size
         return config
 
 
@@ -97,6 +104,8 @@ class AuditSettings(_BasePowermemSettings):
     retention_days: int = Field(default=90)
     compress_logs: bool = Field(default=True)
     log_rotation_size: Optional[str] = Field(default=None)
+    async_logging: bool = Field(default=True)
+    queue_size: int = Field(default=10000)
 
     def to_config(self) -> Dict[str, Any]:
         return self.model_dump()
@@ -487,6 +496,30 @@ class PerformanceSettings(_BasePowermemSettings):
         default=10,
         validation_alias=AliasChoices("MEMORY_SEARCH_LIMIT"),
     )
+    embedding_cache_size: int = Field(
+        default=1000,
+        validation_alias=AliasChoices("MEMORY_EMBEDDING_CACHE_SIZE"),
+    )
+    embedding_cache_ttl: int = Field(
+        default=3600,
+        validation_alias=AliasChoices("MEMORY_EMBEDDING_CACHE_TTL"),
+    )
+    search_cache_size: int = Field(
+        default=0,
+        validation_alias=AliasChoices("MEMORY_SEARCH_CACHE_SIZE"),
+    )
+    search_cache_ttl: int = Field(
+        default=60,
+        validation_alias=AliasChoices("MEMORY_SEARCH_CACHE_TTL"),
+    )
+    llm_cache_size: int = Field(
+        default=0,
+        validation_alias=AliasChoices("MEMORY_LLM_CACHE_SIZE"),
+    )
+    llm_cache_ttl: int = Field(
+        default=3600,
+        validation_alias=AliasChoices("MEMORY_LLM_CACHE_TTL"),
+    )
     memory_search_threshold: float = Field(
         default=0.7,
         validation_alias=AliasChoices("MEMORY_SEARCH_THRESHOLD"),
@@ -112,6 +112,43 @@ class TelemetryConfig(BaseModel):
         default=30,
         description="Interval in seconds to flush telemetry data"
     )
+    queue_size: int = Field(
+        default=10000,
+        description="Maximum telemetry events waiting to be sent; further events are dropped"
+    )
+
+
+class PerformanceConfig(BaseModel):
+    """Configuration for in-process caching and batching."""
+
+    embedding_cache_size: int = Field(
+        default=1000,
+        description="Maximum number of embedding vectors cached in process (0 disables the cache)"
+    )
+    embedding_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds before a cached embedding vector expires"
+    )
+    search_cache_size: int = Field(
+        default=0,
+        description=(
+            "Maximum number of search results cached in process (0 disables the cache). "
+            "Cache hits skip access-count tracking and the intelligence plugin's on_search "
+            "(forgetting-curve) updates"
+        )
+    )
+    search_cache_ttl: int = Field(
+        default=60,
+        description="Seconds before a cached search result expires"
+    )
+    llm_cache_size: int = Field(
+        default=0,
+        description="Maximum number of LLM responses cached in process (0 disables the cache)"
+    )
+    llm_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds before a cached LLM response expires"
+    )
 
 
 class AuditConfig(BaseModel):
@@ -133,6 +170,14 @@ class AuditConfig(BaseModel):
         default=90,
         description="Number of days to retain audit logs"
     )
+    async_logging: bool = Field(
+        default=True,
+        description="Write audit records on a background thread instead of in the calling thread"
+    )
+    queue_size: int = Field(
+        default=10000,
+        description="Maximum audit records waiting for the background writer; further records are dropped"
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -315,6 +360,10 @@ class MemoryConfig(BaseModel):
         description="Configuration for audit logging",
         default=None,
     )
+    performance: Optional[PerformanceConfig] = Field(
+        description="Configuration for in-process caching and batching",
+        default=None,
+    )
     logging: Optional[LoggingConfig] = Field(
         description="Configuration for application logging",
         default=None,
@@ -359,6 +408,8 @@ class MemoryConfig(BaseModel):
             self.telemetry = TelemetryConfig()
         if self.audit is None:
             self.audit = AuditConfig()
+        if self.performance is None:
+            self.performance = PerformanceConfig()
         if self.logging is None:
             self.logging = LoggingConfig()
         if self.reranker is None:
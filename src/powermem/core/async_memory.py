@@ -7,10 +7,8 @@ This module provides the asynchronous memory management interface.
 import asyncio
 import logging
 import warnings
-import hashlib
 import json
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from powermem.utils.utils import get_current_datetime
 from copy import deepcopy
 
@@ -20,12 +18,15 @@ from ..storage.factory import VectorStoreFactory, GraphStoreFactory
 from ..storage.adapter import StorageAdapter, SubStorageAdapter
 from ..intelligence.manager import IntelligenceManager
 from ..integrations.llm.factory import LLMFactory
+from ..integrations.llm.cache import CachedLLM
 from ..integrations.embeddings.factory import EmbedderFactory
+from ..integrations.embeddings.cache import CachedEmbedding
 from .telemetry import TelemetryManager
 from .audit import AuditLogger
 from ..intelligence.plugin import IntelligentMemoryPlugin, EbbinghausIntelligencePlugin
 from ..utils.utils import (
     convert_config_object_to_dict,
+    generate_content_hash,
     parse_vision_messages,
     llm_json_text_with_fallback,
     parse_fact_extraction_json,
@@ -48,6 +49,74 @@ def _forget_marker_updates() -> Dict[str, Any]:
     }
 
 
+# Storage fields copied onto each search result when present
+_EXTRA_RESULT_KEYS = ("id", "created_at", "updated_at", "user_id", "agent_id", "run_id")
+
+
+def _split_category(
+    metadata: Optional[Dict[str, Any]],
+    extra_fields: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Pop ``category`` out of metadata and merge plugin extra fields.
+
+    The caller's dict is copied at most once, and only when it has to change.
+    """
+    if not isinstance(extra_fields, dict):
+        extra_fields = None
+    if not metadata or not isinstance(metadata, dict):
+        return "", dict(extra_fields) if extra_fields else metadata
+    if "category" not in metadata and not extra_fields:
+        return "", metadata
+    category = metadata.get("category", "")
+    metadata = {k: v for k, v in metadata.items() if k != "category"}
+    if extra_fields:
+        metadata.update(extra_fields)
+    return category, metadata
+
+
+def _passes_threshold(result: Dict[str, Any], threshold: Optional[float]) -> bool:
+    """Check a search hit against the threshold.
+
+    Uses the quality score (absolute similarity, 0-1, weighted across all
+    search paths) and falls back to the ranking score for older data or
+    non-hybrid search.
+    """
+    if threshold is None:
+        return True
+    quality_score = result.get("metadata", {}).get("_quality_score")
+    if quality_score is None:
+        quality_score = result.get("score", 0.0)
+    return quality_score >= threshold
+
+
+def _build_search_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a storage hit as {"memory", "metadata", "score", ...} for the search response."""
+    transformed_result = {
+        "memory": result.get("memory", ""),
+        "metadata": result.get("metadata", {}),  # Kept as-is from storage (includes debug info like _quality_score)
+        "score": result.get("score", 0.0),
+    }
+    # Preserve other fields if needed
+    for key in _EXTRA_RESULT_KEYS:
+        if key in result:
+            transformed_result[key] = result[key]
+    return transformed_result
+
+
+def _routing_filters_disjoint(routing_filters: List[Dict[str, Any]]) -> bool:
+    """
+    Whether no record can match two of the routing filters.
+
+    Two equality filters are disjoint only if they require different values
+    for some shared key; otherwise one record could satisfy both.
+    """
+    for i, first in enumerate(routing_filters):
+        for second in routing_filters[i + 1:]:
+            if not any(first[key] != second[key] for key in first.keys() & second.keys()):
+                return False
+    return True
+
+
 def _auto_convert_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert legacy powermem config to format for compatibility.
@@ -166,12 +235,14 @@ class AsyncMemory(MemoryBase):
 
         # Extract LLM config
         llm_config = self._get_component_config('llm')
-        self.llm = LLMFactory.create(self.llm_provider, llm_config)
+        self.llm = self._with_llm_cache(LLMFactory.create(self.llm_provider, llm_config))
         
         # Extract embedder config
         embedder_config = self._get_component_config('embedder')
         # Pass vector_store_config so factory can extract embedding_model_dims for mock embeddings
-        self.embedding = EmbedderFactory.create(self.embedding_provider, embedder_config, vector_store_config)
+        self.embedding = self._with_embedding_cache(
+            EmbedderFactory.create(self.embedding_provider, embedder_config, vector_store_config)
+        )
         
         # Initialize storage adapter with embedding service
         # Automatically select adapter based on sub_stores configuration
@@ -205,6 +276,8 @@ class AsyncMemory(MemoryBase):
 
         # Intelligent memory plugin (pluggable)
         merged_cfg = self._get_intelligent_memory_config()
+        # Resolved once: add() consults it on every call
+        self._fallback_to_simple_add = bool(merged_cfg.get("fallback_to_simple_add", False))
 
         plugin_type = merged_cfg.get("plugin", "ebbinghaus")
         self._intelligence_plugin: Optional[IntelligentMemoryPlugin] = None
@@ -221,6 +294,9 @@ class AsyncMemory(MemoryBase):
         
         # Sub stores configuration (support multiple)
         self.sub_stores_config: List[Dict] = []
+        # Union of routing_filter keys across sub stores, so requests whose
+        # filters/metadata share none of them skip the routing scan
+        self._sub_store_routing_keys: Set[str] = set()
 
         # Initialize sub stores
         self._init_sub_stores()
@@ -253,6 +329,17 @@ class AsyncMemory(MemoryBase):
         """Return True when PowerMem is running without LLM-backed features."""
         return self.llm_provider == "noop" or getattr(self.llm, "is_noop", False) is True
 
+    def _is_embedded_store(self) -> bool:
+        """Return True when storage is embedded seekdb.
+
+        The embedded engine is single-threaded (NullPool, not thread-safe);
+        concurrent connections from worker threads crash the C++ layer, so
+        callers must not fan storage calls out to threads.
+        """
+        vector_store = getattr(self.storage, 'vector_store', None)
+        connection_args = getattr(vector_store, 'connection_args', None)
+        return connection_args is not None and not connection_args.get("host")
+
     def _get_component_config(self, component: str) -> Dict[str, Any]:
         """
         Helper method to get component configuration uniformly.
@@ -306,6 +393,37 @@ class AsyncMemory(MemoryBase):
             if "custom_importance_evaluation_prompt" in self.config:
                 merged_cfg["custom_importance_evaluation_prompt"] = self.config["custom_importance_evaluation_prompt"]
             return merged_cfg
+
+    def _get_performance_config(self) -> Dict[str, Any]:
+        """
+        Helper method to get performance (caching/batching) configuration.
+
+        Returns:
+            Performance configuration dictionary
+        """
+        if self.memory_config and self.memory_config.performance:
+            return self.memory_config.performance.model_dump()
+        return (self.config or {}).get("performance") or {}
+
+    def _with_llm_cache(self, llm: Any) -> Any:
+        """Wrap the LLM with the in-process response cache when enabled (off by default)."""
+        performance_cfg = self._get_performance_config()
+        cache_size = performance_cfg.get("llm_cache_size", 0)
+        if not cache_size or cache_size <= 0:
+            return llm
+        return CachedLLM(llm, maxsize=cache_size, ttl=performance_cfg.get("llm_cache_ttl", 3600))
+
+    def _with_embedding_cache(self, embedding: Any) -> Any:
+        """Wrap an embedding service with the in-process embedding cache unless disabled."""
+        performance_cfg = self._get_performance_config()
+        cache_size = performance_cfg.get("embedding_cache_size", 1000)
+        if not cache_size or cache_size <= 0:
+            return embedding
+        return CachedEmbedding(
+            embedding,
+            maxsize=cache_size,
+            ttl=performance_cfg.get("embedding_cache_ttl", 3600),
+        )
     
     async def _extract_facts(self, messages: Any) -> List[str]:
         """
@@ -573,7 +691,7 @@ class AsyncMemory(MemoryBase):
                 enhanced_metadata = {**enhanced_metadata, **extra_fields}
 
         # Generate content hash for deduplication
-        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+        content_hash = generate_content_hash(content, user_id, agent_id or self.agent_id)
 
         # Extract category from enhanced metadata if present
         category = ""
@@ -598,6 +716,9 @@ class AsyncMemory(MemoryBase):
         # Use self.agent_id as fallback if agent_id is not provided
         agent_id = agent_id or self.agent_id
         
+        # created_at and updated_at share one timestamp
+        now = get_current_datetime()
+
         # Store in database asynchronously
         memory_data = {
             "content": content,
@@ -609,8 +730,8 @@ class AsyncMemory(MemoryBase):
             "category": category,
             "metadata": enhanced_metadata or {},
             "filters": filters or {},
-            "created_at": get_current_datetime(),
-            "updated_at": get_current_datetime(),
+            "created_at": now,
+            "updated_at": now,
         }
 
         memory_id = await self.storage.add_memory_async(memory_data)
@@ -644,7 +765,7 @@ class AsyncMemory(MemoryBase):
                 "agent_id": agent_id,
                 "run_id": run_id,
                 "metadata": metadata,
-                "created_at": memory_data["created_at"].isoformat() if isinstance(memory_data["created_at"], datetime) else memory_data["created_at"],
+                "created_at": now.isoformat(),
             }]
         }
         if graph_result:
@@ -667,9 +788,7 @@ class AsyncMemory(MemoryBase):
         # Use self.agent_id as fallback if agent_id is not provided
         agent_id = agent_id or self.agent_id
         
-        # Get intelligent memory config to check fallback setting
-        intelligent_config = self._get_intelligent_memory_config()
-        fallback_to_simple = intelligent_config.get("fallback_to_simple_add", False)
+        fallback_to_simple = self._fallback_to_simple_add
         
         # Step 1: Extract facts from messages
         logger.info("Extracting facts from messages...")
@@ -683,34 +802,46 @@ class AsyncMemory(MemoryBase):
             return {"results": []}
 
         logger.info(f"Extracted {len(facts)} facts: {facts}")
+
+        # Drop exact duplicate facts (the extractor sometimes repeats itself) so
+        # each distinct fact is embedded and searched only once
+        unique_facts = list(dict.fromkeys(facts))
+        if len(unique_facts) < len(facts):
+            logger.debug(f"Skipped {len(facts) - len(unique_facts)} duplicate facts")
+            facts = unique_facts
         
         # Step 2: Search for similar memories for each fact
         existing_memories = []
-        fact_embeddings = {}
         
         # Select embedding service based on metadata (for sub-store routing)
         embedding_service = self._get_embedding_service(metadata)
 
-        for fact in facts:
-            fact_embedding = await asyncio.to_thread(embedding_service.embed, fact, memory_action="add")
-            fact_embeddings[fact] = fact_embedding
-            
-            # Merge metadata into filters for correct routing
-            search_filters = filters.copy() if filters else {}
-            if metadata:
-                # Filter metadata to only include simple values (strings, numbers, booleans, None)
-                # This prevents nested dicts like {'agent': {'agent_id': ...}} from causing issues
-                # when OceanBase's build_condition tries to parse them as operators
-                simple_metadata = {
-                    k: v for k, v in metadata.items()
-                    if not isinstance(v, (dict, list)) and k not in ['agent_id', 'user_id', 'run_id']
-                }
-                search_filters.update(simple_metadata)
+        # Embed all facts in one batch call (providers without a native batch
+        # API fall back to EmbeddingBase.embed_batch's sequential loop)
+        fact_embeddings = dict(zip(
+            facts,
+            await asyncio.to_thread(embedding_service.embed_batch, facts, memory_action="add"),
+        ))
+
+        # Merge metadata into filters for correct routing. The result is the same
+        # for every fact, so build it once; the storage adapter copies filters
+        # before adding its own keys and never mutates this dict.
+        search_filters = filters.copy() if filters else {}
+        if metadata:
+            # Filter metadata to only include simple values (strings, numbers, booleans, None)
+            # This prevents nested dicts like {'agent': {'agent_id': ...}} from causing issues
+            # when OceanBase's build_condition tries to parse them as operators
+            simple_metadata = {
+                k: v for k, v in metadata.items()
+                if not isinstance(v, (dict, list)) and k not in ['agent_id', 'user_id', 'run_id']
+            }
+            search_filters.update(simple_metadata)
 
+        async def _search_similar(fact: str) -> List[Dict[str, Any]]:
             # Search for similar memories with reduced limit to reduce noise
             # Pass fact text to enable hybrid search for better results
-            similar = await self.storage.search_memories_async(
-                query_embedding=fact_embedding,
+            return await self.storage.search_memories_async(
+                query_embedding=fact_embeddings[fact],
                 user_id=user_id,
                 agent_id=agent_id,
                 run_id=run_id,
@@ -718,24 +849,31 @@ class AsyncMemory(MemoryBase):
                 limit=5,
                 query=fact  # Enable hybrid search
             )
+
+        # The per-fact searches are independent I/O round trips, so run them
+        # concurrently. gather() keeps fact order so deduplication stays deterministic.
+        # Embedded seekdb is not thread-safe and is searched sequentially.
+        if len(facts) > 1 and not self._is_embedded_store():
+            per_fact_results = await asyncio.gather(*(_search_similar(fact) for fact in facts))
+        else:
+            per_fact_results = [await _search_similar(fact) for fact in facts]
+        for similar in per_fact_results:
             existing_memories.extend(similar)
         
-        # Improved deduplication: prefer memories with better similarity scores
+        # Improved deduplication: prefer memories with better similarity scores.
+        # A stable sort by distance puts the closest copy of each ID first, so a
+        # single setdefault pass keeps it.
+        existing_memories.sort(key=lambda m: m.get("distance", float('inf')))
+        # Candidates are limited to avoid LLM prompt overload, so the pass stops
+        # as soon as the closest 10 distinct memories are collected.
         unique_memories = {}
         for mem in existing_memories:
             mem_id = mem.get("id")
             if mem_id and mem_id not in unique_memories:
                 unique_memories[mem_id] = mem
-            elif mem_id:
-                # If duplicate ID, keep the one with better similarity (lower distance)
-                existing = unique_memories.get(mem_id)
-                mem_distance = mem.get("distance", float('inf'))
-                existing_distance = existing.get("distance", float('inf')) if existing else float('inf')
-                if mem_distance < existing_distance:
-                    unique_memories[mem_id] = mem
-        
-        # Limit candidates to avoid LLM prompt overload
-        existing_memories = list(unique_memories.values())[:10]  # Max 10 memories
+                if len(unique_memories) == 10:  # Max 10 memories
+                    break
+        existing_memories = list(unique_memories.values())
         
         logger.info(f"Found {len(existing_memories)} existing memories to consider (after dedup and limiting)")
         
@@ -775,7 +913,8 @@ class AsyncMemory(MemoryBase):
                 logger.warning(f"Skipping action with empty text: {action}")
                 continue
             
-            logger.debug(f"Processing action: {event_type} - '{action_text[:50] if action_text else 'NONE'}...' (id: {action_id})")
+            # Lazy %-formatting: the message is only built when debug logging is on
+            logger.debug("Processing action: %s - '%.50s...' (id: %s)", event_type, action_text or "NONE", action_id)
             
             try:
                 if event_type == "ADD":
@@ -967,11 +1106,14 @@ class AsyncMemory(MemoryBase):
                 enhanced_metadata = {"scope": scope}
         
         # Generate content hash
-        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+        content_hash = generate_content_hash(content, user_id, agent_id or self.agent_id)
         
         # Use self.agent_id as fallback if agent_id is not provided
         agent_id = agent_id or self.agent_id
         
+        # created_at and updated_at share one timestamp
+        now = get_current_datetime()
+
         # Create memory data
         memory_data = {
             "content": content,
@@ -983,14 +1125,34 @@ class AsyncMemory(MemoryBase):
             "category": category,
             "metadata": enhanced_metadata or {},
             "filters": filters or {},
-            "created_at": get_current_datetime(),
-            "updated_at": get_current_datetime(),
+            "created_at": now,
+            "updated_at": now,
         }
         
         memory_id = await self.storage.add_memory_async(memory_data)
         
         return memory_id
     
+    async def _hash_for_update_async(
+        self,
+        memory_id: int,
+        content: str,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Tuple[Optional[str], str]:
+        """
+        Hash new content for a stored memory against the memory's own owner.
+
+        Returns:
+            ``(stored hash, new hash)``; the stored hash is None if the memory
+            is missing or inaccessible
+        """
+        hash_and_owner = await self.storage.get_memory_hash_and_owner_async(memory_id, user_id, agent_id)
+        if hash_and_owner is None:
+            return None, generate_content_hash(content, user_id, agent_id)
+        stored_hash, owner_user_id, owner_agent_id = hash_and_owner
+        return stored_hash, generate_content_hash(content, owner_user_id, owner_agent_id)
+
     async def _update_memory_async(
         self,
         memory_id: int,
@@ -1008,12 +1170,22 @@ class AsyncMemory(MemoryBase):
         if not content or not content.strip():
             raise ValueError(f"Cannot update memory with empty content: '{content}'")
         
+        # Generate content hash
+        stored_hash, content_hash = await self._hash_for_update_async(memory_id, content, user_id, agent_id)
+        
         # Generate or use existing embedding
         if existing_embeddings and content in existing_embeddings:
             embedding = existing_embeddings[content]
         else:
-            # If no metadata provided, try to get existing memory's metadata
-            if metadata is None:
+            # Unchanged content keeps its stored embedding: only touch updated_at
+            if stored_hash == content_hash:
+                logger.debug(f"Memory {memory_id} content unchanged, skipping re-embedding")
+                await self.storage.update_memory_async(memory_id, {"updated_at": get_current_datetime()}, user_id, agent_id)
+                return
+
+            # If no metadata provided, look up the existing memory's metadata;
+            # it is only needed to route the embedding to a sub store
+            if metadata is None and self.sub_stores_config:
                 existing = await self.storage.get_memory_async(memory_id, user_id, agent_id)
                 if existing:
                     metadata = existing.get("metadata", {})
@@ -1023,9 +1195,6 @@ class AsyncMemory(MemoryBase):
 
             embedding = await asyncio.to_thread(embedding_service.embed, content, memory_action="update")
         
-        # Generate content hash
-        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-        
         update_data = {
             "content": content,
             "embedding": embedding,
@@ -1097,56 +1266,21 @@ class AsyncMemory(MemoryBase):
             # Intelligent plugin lifecycle management on search
             if self._intelligence_plugin and self._intelligence_plugin.enabled:
                 updates, deletes = self._intelligence_plugin.on_search(processed_results)
-                for mem_id, upd in updates:
-                    try:
-                        await self.storage.update_memory_async(mem_id, {**upd}, user_id, agent_id)
-                    except Exception:
-                        continue
                 # The plugin's "deletes" are memories that should be
                 # forgotten by marking, not physically removed from storage.
-                for mem_id in deletes:
-                    try:
-                        await self.storage.update_memory_async(
-                            mem_id,
-                            _forget_marker_updates(),
-                            user_id,
-                            agent_id,
-                        )
-                    except Exception:
-                        continue
+                pending_updates = [(mem_id, {**upd}) for mem_id, upd in updates or []]
+                pending_updates.extend((mem_id, _forget_marker_updates()) for mem_id in deletes or [])
+                if pending_updates:
+                    # Per-item failures are logged and skipped by the storage layer
+                    await self.storage.update_memories_async(pending_updates, user_id, agent_id)
             
             # Transform results to match benchmark expected format
             # Benchmark expects: {"results": [{"memory": ..., "metadata": {...}, "score": ...}], "relations": [...]}
-            transformed_results = []
-            for result in processed_results:
-                score = result.get("score", 0.0)
-                
-                # Get quality score for threshold filtering
-                # Quality score represents absolute similarity quality (0-1 range)
-                # It's calculated from weighted average of all search paths' similarity scores
-                metadata = result.get("metadata", {})
-                quality_score = metadata.get("_quality_score")
-                
-                # If quality_score is not available (e.g., from older data or non-hybrid search),
-                # fall back to using the ranking score
-                if quality_score is None:
-                    quality_score = score
-                
-                # Apply threshold filtering using quality score
-                # Only include results if threshold is None or quality_score >= threshold
-                if threshold is not None and quality_score < threshold:
-                    continue
-                
-                transformed_result = {
-                    "memory": result.get("memory", ""), 
-                    "metadata": metadata,  # Keep metadata as-is from storage (includes debug info like _quality_score)
-                    "score": score,
-                }
-                # Preserve other fields if needed
-                for key in ["id", "created_at", "updated_at", "user_id", "agent_id", "run_id"]:
-                    if key in result:
-                        transformed_result[key] = result[key]
-                transformed_results.append(transformed_result)
+            transformed_results = [
+                _build_search_result(result)
+                for result in processed_results
+                if _passes_threshold(result, threshold)
+            ]
             
             # Log audit event
             await self.audit.log_event_async("memory.search", {
@@ -1256,17 +1390,26 @@ class AsyncMemory(MemoryBase):
             if not content or not content.strip():
                 raise ValueError(f"Cannot update memory with empty content: '{content}'")
 
-            # If no metadata provided, try to get existing memory's metadata
-            if metadata is None:
+            # If no metadata provided, look up the existing memory's metadata;
+            # it is only needed to route the embedding to a sub store (the
+            # storage layer checks access and merges metadata on its own)
+            existing = None
+            if metadata is None and self.sub_stores_config:
                 existing = await self.storage.get_memory_async(memory_id, user_id, agent_id)
                 if existing:
                     metadata = existing.get("metadata", {})
 
-            # Select embedding service based on metadata (for sub-store routing)
-            embedding_service = self._get_embedding_service(metadata)
+            # Generate content hash for deduplication
+            stored_hash, content_hash = await self._hash_for_update_async(memory_id, content, user_id, agent_id)
 
-            # Generate new embedding asynchronously
-            embedding = await asyncio.to_thread(embedding_service.embed, content, memory_action="update")
+            # Unchanged content keeps its stored embedding
+            embedding = None
+            if stored_hash != content_hash:
+                # Select embedding service based on metadata (for sub-store routing)
+                embedding_service = self._get_embedding_service(metadata)
+
+                # Generate new embedding asynchronously
+                embedding = await asyncio.to_thread(embedding_service.embed, content, memory_action="update")
             
             # Process metadata with intelligence manager (if enabled)
             # Disabled LLM-based importance evaluation to save tokens (consistent with add method)
@@ -1276,35 +1419,33 @@ class AsyncMemory(MemoryBase):
             # Intelligent plugin annotations
             extra_fields = {}
             if self._intelligence_plugin and self._intelligence_plugin.enabled:
-                # Get existing memory for context
-                existing_memory = await self.get(memory_id, user_id=user_id)
-                if existing_memory:
-                    # Plugin can process update event
-                    extra_fields = self._intelligence_plugin.on_add(content=content, metadata=enhanced_metadata)
-            
-            # Generate content hash for deduplication
-            content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-            
-            # Extract category from enhanced metadata if present
-            category = ""
-            if enhanced_metadata and isinstance(enhanced_metadata, dict):
-                category = enhanced_metadata.get("category", "")
-                # Remove category from metadata to avoid duplication
-                enhanced_metadata = {k: v for k, v in enhanced_metadata.items() if k != "category"}
+                # Get existing memory for context, reusing the routing lookup
+                if existing is None:
+                    existing = await self.storage.get_memory_async(memory_id, user_id, agent_id)
+                if existing:
+                    # Plugin can process update event; without new metadata it
+                    # scores the memory against its stored metadata
+                    extra_fields = self._intelligence_plugin.on_add(
+                        content=content,
+                        metadata=enhanced_metadata if enhanced_metadata is not None else existing.get("metadata"),
+                    )
             
-            # Merge extra fields from intelligence plugin
-            if extra_fields and isinstance(extra_fields, dict):
-                enhanced_metadata = {**(enhanced_metadata or {}), **extra_fields}
+            # Move category out of the metadata and merge the plugin's extra
+            # fields, copying the metadata only when either changes it
+            category, enhanced_metadata = _split_category(enhanced_metadata, extra_fields)
 
             # Update in storage asynchronously
             update_data = {
                 "content": content,
-                "embedding": embedding,
-                "metadata": enhanced_metadata,
                 "hash": content_hash,  # Update hash
                 "category": category,
                 "updated_at": get_current_datetime(),
             }
+            if embedding is not None:
+                update_data["embedding"] = embedding
+            # Without new metadata the stored metadata is kept as-is
+            if enhanced_metadata is not None:
+                update_data["metadata"] = enhanced_metadata
             
             result = await self.storage.update_memory_async(memory_id, update_data, user_id, agent_id)
             
@@ -1320,6 +1461,104 @@ class AsyncMemory(MemoryBase):
         except Exception as e:
             logger.error(f"Failed to update memory {memory_id}: {e}")
             raise
+
+    async def update_many(
+        self,
+        updates: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Update several memories at once asynchronously.
+
+        Contents are embedded with one ``embed_batch`` call per embedding
+        service and written through a single storage batch call.
+
+        Args:
+            updates: List of update items, each containing:
+                - memory_id: Memory ID to update
+                - content: New memory content
+                - metadata: Optional metadata to merge into the stored metadata
+            user_id: User ID for access control
+            agent_id: Agent ID for access control
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The updated memory data for each item, in input
+                order; None where the memory was not found, access was denied or the write failed.
+        """
+        try:
+            for item in updates:
+                content = item.get("content")
+                if not content or not content.strip():
+                    raise ValueError(f"Cannot update memory {item.get('memory_id')} with empty content: '{content}'")
+
+            # Embed all contents with one batch call per embedding service (sub-store routing)
+            embeddings: List[Any] = [None] * len(updates)
+            indices_by_service: Dict[int, List[int]] = {}
+            services: Dict[int, Any] = {}
+            for idx, item in enumerate(updates):
+                routing_metadata = item.get("metadata")
+                if routing_metadata is None and self.sub_stores_config:
+                    existing = await self.storage.get_memory_async(item["memory_id"], user_id, agent_id)
+                    routing_metadata = existing.get("metadata", {}) if existing else None
+                service = self._get_embedding_service(routing_metadata)
+                services[id(service)] = service
+                indices_by_service.setdefault(id(service), []).append(idx)
+            for key, indices in indices_by_service.items():
+                vectors = await asyncio.to_thread(
+                    services[key].embed_batch,
+                    [updates[idx]["content"] for idx in indices],
+                    memory_action="update",
+                )
+                for idx, vector in zip(indices, vectors):
+                    embeddings[idx] = vector
+
+            # Hash each content against its stored owner
+            hashes = await asyncio.gather(*(
+                self._hash_for_update_async(item["memory_id"], item["content"], user_id, agent_id)
+                for item in updates
+            ))
+
+            now = get_current_datetime()
+            batch = []
+            for item, embedding, (_, content_hash) in zip(updates, embeddings, hashes):
+                content = item["content"]
+                enhanced_metadata = item.get("metadata")
+
+                # Extract category from metadata if present
+                category, enhanced_metadata = _split_category(enhanced_metadata)
+
+                # Intelligent plugin annotations
+                if self._intelligence_plugin and self._intelligence_plugin.enabled:
+                    extra_fields = self._intelligence_plugin.on_add(content=content, metadata=enhanced_metadata)
+                    _, enhanced_metadata = _split_category(enhanced_metadata, extra_fields)
+
+                update_data = {
+                    "content": content,
+                    "embedding": embedding,
+                    "hash": content_hash,
+                    "category": category,
+                    "updated_at": now,
+                }
+                # Without new metadata the stored metadata is kept as-is
+                if enhanced_metadata is not None:
+                    update_data["metadata"] = enhanced_metadata
+                batch.append((item["memory_id"], update_data))
+
+            results = await self.storage.update_memories_async(batch, user_id, agent_id)
+
+            # One audit event for the whole batch
+            await self.audit.log_event_async("memory.update_many", {
+                "memory_ids": [memory_id for memory_id, _ in batch],
+                "updated_count": sum(1 for result in results if result is not None),
+                "user_id": user_id,
+                "agent_id": agent_id
+            }, user_id=user_id, agent_id=agent_id)
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to update memories in batch: {e}")
+            raise
     
     async def delete(
         self,
@@ -1459,9 +1698,10 @@ class AsyncMemory(MemoryBase):
                 logger.warning("Vector store does not support reset. Skipping.")
                 await asyncio.to_thread(self.storage.vector_store.delete_col)
                 # Recreate vector store
-                from ..storage.factory import VectorStoreFactory
                 vector_store_config = self._get_component_config('vector_store')
-                self.storage.vector_store = VectorStoreFactory.create(self.storage_type, vector_store_config)
+                self.storage.vector_store = await asyncio.to_thread(
+                    VectorStoreFactory.create, self.storage_type, vector_store_config
+                )
                 # Update storage adapter
                 self.storage = StorageAdapter(self.storage.vector_store, self.embedding)
             
@@ -1547,11 +1787,11 @@ class AsyncMemory(MemoryBase):
 
             # Create a config dict with embedding_model_dims for mock embeddings
             sub_vector_config = {'embedding_model_dims': embedding_model_dims}
-            sub_embedding = EmbedderFactory.create(
+            sub_embedding = self._with_embedding_cache(EmbedderFactory.create(
                 sub_embedding_provider,
                 sub_embedding_params,
                 sub_vector_config
-            )
+            ))
             logger.info(f"Created sub embedding service for store {index}: {sub_embedding_provider}")
         else:
             # Reuse main table's embedding service
@@ -1580,6 +1820,7 @@ class AsyncMemory(MemoryBase):
             'embedding_service': sub_embedding,
             'embedding_dims': embedding_model_dims,
         })
+        self._sub_store_routing_keys.update(routing_filter)
 
         logger.info(f"Registered sub store {index}: {sub_store_name} (dims={embedding_model_dims})")
 
@@ -1596,21 +1837,22 @@ class AsyncMemory(MemoryBase):
         if not filters_or_metadata or not self.sub_stores_config:
             return self.embedding
 
+        # No routing key present: no sub store can match
+        if self._sub_store_routing_keys.isdisjoint(filters_or_metadata):
+            return self.embedding
+
         # Iterate through all sub stores to find a match
         if isinstance(self.storage, SubStorageAdapter):
             for sub_config in self.sub_stores_config:
-                # Check if sub store is ready
+                # Match routing rules first (an in-memory items-view subset
+                # test), then the readiness check, which queries the status table
+                if not sub_config['routing_filter'].items() <= filters_or_metadata.items():
+                    continue
                 if not self.storage.is_sub_store_ready(sub_config['name']):
                     continue
 
-                # Check if filters_or_metadata matches routing rules
-                routing_filter = sub_config['routing_filter']
-                if all(
-                    key in filters_or_metadata and filters_or_metadata[key] == value
-                    for key, value in routing_filter.items()
-                ):
-                    logger.debug(f"Using sub embedding for store: {sub_config['name']}")
-                    return sub_config['embedding_service']
+                logger.debug(f"Using sub embedding for store: {sub_config['name']}")
+                return sub_config['embedding_service']
 
         logger.debug("Using main embedding service")
         return self.embedding
@@ -1661,16 +1903,32 @@ class AsyncMemory(MemoryBase):
                 Each key is a sub store name (str), and each value is the count of migrated records (int).
                 If migration fails for a sub store, its count will be 0.
         """
-        results = {}
-        for index, sub_config in enumerate(self.sub_stores_config):
+        async def _migrate(index: int) -> int:
             try:
-                count = await self.migrate_to_sub_store(index, delete_source)
-                results[sub_config['name']] = count
+                return await self.migrate_to_sub_store(index, delete_source)
             except Exception as e:
                 logger.error(f"Failed to migrate sub store {index}: {e}")
-                results[sub_config['name']] = 0
+                return 0
+
+        # Sub stores with disjoint routing filters page over disjoint source
+        # rows into their own collections, so their migrations overlap safely.
+        # Overlapping filters would copy or delete the same rows from two
+        # workers, and embedded seekdb is not thread-safe: both run sequentially.
+        indices = range(len(self.sub_stores_config))
+        concurrent = (
+            len(indices) > 1
+            and not self._is_embedded_store()
+            and _routing_filters_disjoint([c['routing_filter'] for c in self.sub_stores_config])
+        )
+        if concurrent:
+            counts = await asyncio.gather(*(_migrate(index) for index in indices))
+        else:
+            counts = [await _migrate(index) for index in indices]
 
-        return results
+        return {
+            sub_config['name']: count
+            for sub_config, count in zip(self.sub_stores_config, counts)
+        }
 
     @classmethod
     async def from_config(cls, config: Optional[Dict[str, Any]] = None, **kwargs):
@@ -4,9 +4,11 @@ Audit logging for memory operations
 This module handles audit logging for compliance and security.
 """
 
+import atexit
 import logging
 import json
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any, Dict, Optional
 from datetime import datetime
 from powermem.utils.utils import get_current_datetime
@@ -15,6 +17,42 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Background writer shared by every AuditLogger (they all log to the single
+# "audit" logger, whose handlers are set up once).
+_audit_listener: Optional[QueueListener] = None
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _stop_audit_listener() -> None:
+    """Drain pending audit records to disk at interpreter exit."""
+    global _audit_listener
+    if _audit_listener is not None:
+        _audit_listener.stop()
+        _audit_listener = None
+
+
+atexit.register(_stop_audit_listener)
+
+
+def _flush_audit_listener() -> None:
+    """Wait until the background writer has written every queued audit record."""
+    if _audit_listener is not None:
+        # QueueListener marks each record done once its handlers have run
+        _audit_listener.queue.join()
+
 
 class AuditLogger:
     """
@@ -68,7 +106,19 @@ class AuditLogger:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             handler.setFormatter(formatter)
-            self.audit_logger.addHandler(handler)
+            if self._get_config_value(["async_logging"], True):
+                # Write audit records on a background thread so memory
+                # operations never wait on disk I/O; the bounded queue drops
+                # records rather than blocking when the writer falls behind.
+                global _audit_listener
+                log_queue: queue.Queue = queue.Queue(
+                    maxsize=self._get_config_value(["queue_size"], 10000)
+                )
+                _audit_listener = QueueListener(log_queue, handler)
+                _audit_listener.start()
+                self.audit_logger.addHandler(_DroppingQueueHandler(log_queue))
+            else:
+                self.audit_logger.addHandler(handler)
         
         logger.info(
             f"AuditLogger initialized - enabled: {self.enabled}, log_file: {self.log_file}"
@@ -260,6 +310,9 @@ class AuditLogger:
         logs = []
         
         try:
+            # Records may still be queued for the background writer
+            _flush_audit_listener()
+
             if os.path.exists(self.log_file):
                 with open(self.log_file, 'r') as f:
                     for line in f:
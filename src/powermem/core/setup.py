@@ -4,6 +4,7 @@ Setup utilities for powermem
 This module provides setup functions compatible with initialization,
 """
 
+import functools
 import json
 import os
 import uuid
@@ -53,17 +54,26 @@ def setup_config():
             json.dump(config, config_file, indent=4)
 
 
-def get_user_id() -> str:
-    """Get or create user ID."""
+@functools.lru_cache(maxsize=1)
+def _load_user_id() -> Optional[str]:
+    """Read the user ID from config.json, creating the file first if needed.
+
+    Cached so the file is read once per process; failures raise and are
+    therefore not cached. Call ``_load_user_id.cache_clear()`` to re-read.
+    """
     config_path = os.path.join(powermem_dir, "config.json")
     if not os.path.exists(config_path):
         setup_config()
-    
+
+    with open(config_path, "r") as config_file:
+        config = json.load(config_file)
+        return config.get("user_id")
+
+
+def get_user_id() -> str:
+    """Get or create user ID."""
     try:
-        with open(config_path, "r") as config_file:
-            config = json.load(config_file)
-            user_id = config.get("user_id")
-            return user_id
+        return _load_user_id()
     except Exception:
         return "anonymous_user"
 
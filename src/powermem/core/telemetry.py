@@ -4,20 +4,53 @@ Telemetry management for memory operations
 This module handles telemetry data collection and reporting.
 """
 
+import atexit
 import logging
 import json
+import queue
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from datetime import datetime
 from powermem.utils.utils import get_current_datetime
-import httpx
+
+if TYPE_CHECKING:
+    import httpx
+
+# orjson is optional: it serializes event batches faster and straight to bytes
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Queued after the pending events to tell the background worker to exit
+_STOP = object()
+
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a telemetry payload to a JSON request body."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            # orjson rejects a few types the stdlib accepts (e.g. int subclasses
+            # beyond 64 bits); fall back rather than drop the batch
+            pass
+    return json.dumps(payload).encode("utf-8")
+
 
 class TelemetryManager:
     """
     Manages telemetry data collection and reporting.
+
+    Events are queued by the caller and sent in batches by a background
+    thread, so capturing an event never waits on the network. ``flush()``
+    and ``close()`` hand off to that thread and wait for it, so a batch it
+    is still holding back for ``flush_interval`` is sent too.
     """
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -45,8 +78,31 @@ class TelemetryManager:
             ["flush_interval", "telemetry_flush_interval"], 30
         )
         
-        self.events = []
+        self.queue_size = self._get_config_value(
+            ["queue_size", "telemetry_queue_size"], 10000
+        )
+        
+        # Bounded so a slow or unreachable endpoint cannot grow memory; events
+        # that do not fit are dropped and counted.
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.queue_size)
+        self.dropped = 0
         self.last_flush = time.time()
+        self._worker: Optional[threading.Thread] = None
+        self._client: Optional["httpx.Client"] = None
+        if self.enabled:
+            # httpx is only imported when telemetry is on (it is off by default)
+            import httpx
+
+            # One client for the manager's lifetime so batches reuse keep-alive connections
+            self._client = httpx.Client(
+                timeout=10.0, limits=httpx.Limits(max_keepalive_connections=4)
+            )
+            self._worker = threading.Thread(
+                target=self._run_worker, name="powermem-telemetry", daemon=True
+            )
+            self._worker.start()
+            # Send whatever is still queued when the interpreter exits
+            atexit.register(self.close)
 
     def _get_config_value(self, keys, default):
         for key in keys:
@@ -85,18 +141,59 @@ class TelemetryManager:
                 "version": "1.1.5",
             }
             
-            self.events.append(event)
-            
-            # Flush if batch size reached
-            if len(self.events) >= self.batch_size:
-                self._flush_events()
+            self._enqueue(event)
             
         except Exception as e:
             logger.error(f"Failed to capture telemetry event: {e}")
+
+    def _enqueue(self, event: Dict[str, Any]) -> None:
+        """Queue an event for the background sender, dropping it if the queue is full."""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run_worker(self) -> None:
+        """Send queued events in batches of ``batch_size`` or every ``flush_interval`` seconds."""
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+        while True:
+            # Block until there is something to send; once a batch is started,
+            # wait no longer than its flush deadline
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, dict):
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            self._flush_events(batch)
+            batch = []
+            if isinstance(item, threading.Event):
+                # flush() request: everything queued before it has been sent
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _drain_queue(self, limit: int) -> List[Dict[str, Any]]:
+        """Take up to ``limit`` queued events without blocking."""
+        events = []
+        while len(events) < limit:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
     
-    def _flush_events(self) -> None:
+    def _flush_events(self, events: List[Dict[str, Any]]) -> None:
         """Flush events to the telemetry endpoint."""
-        if not self.events or not self.enabled:
+        # The client exists from init until close() (only when enabled); close()
+        # disables capture first but still sends what was already queued
+        if not events or self._client is None:
             return
         
         try:
@@ -109,15 +206,11 @@ class TelemetryManager:
                 headers = {"Content-Type": "application/json"}
             
             payload = {
-                "events": self.events.copy(),
+                "events": events,
                 "timestamp": get_current_datetime().isoformat(),
             }
             
-            # Send events asynchronously to avoid blocking
             self._send_events_async(payload, headers)
-            
-            # Clear events after sending
-            self.events.clear()
             self.last_flush = time.time()
             
         except Exception as e:
@@ -126,44 +219,104 @@ class TelemetryManager:
     def _send_events_async(self, payload: Dict[str, Any], headers: Dict[str, str]) -> None:
         """Send events asynchronously."""
         try:
+            # Serialize once; headers already carry Content-Type: application/json
+            body = _encode_payload(payload)
+
             # Try to get current event loop
             import asyncio
             try:
                 loop = asyncio.get_running_loop()
                 # If we're in an async context, schedule the task
-                asyncio.create_task(self._send_request(payload, headers))
+                asyncio.create_task(self._send_request(body, headers))
             except RuntimeError:
-                # No running event loop, use httpx in sync mode for now
-                import httpx
+                # No running event loop (e.g. the background worker): send synchronously
                 try:
-                    with httpx.Client(timeout=10.0) as client:
-                        response = client.post(
-                            f"{self.endpoint}/events",
-                            json=payload,
-                            headers=headers,
-                            timeout=10.0
-                        )
-                        response.raise_for_status()
+                    response = self._client.post(
+                        f"{self.endpoint}/events",
+                        content=body,
+                        headers=headers,
+                        timeout=10.0
+                    )
+                    response.raise_for_status()
                 except Exception as sync_e:
                     logger.debug(f"Failed to send telemetry events synchronously: {sync_e}")
             
         except Exception as e:
             logger.debug(f"Failed to send telemetry events: {e}")
     
-    async def _send_request(self, payload: Dict[str, Any], headers: Dict[str, str]) -> None:
+    async def _send_request(self, body: bytes, headers: Dict[str, str]) -> None:
         """Helper method to send HTTP request asynchronously."""
+        import httpx
+
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 f"{self.endpoint}/events",
-                json=payload,
+                content=body,
                 headers=headers,
                 timeout=10.0
             )
             response.raise_for_status()
     
-    def flush(self) -> None:
-        """Manually flush all pending events."""
-        self._flush_events()
+    def _worker_alive(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def flush(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        Send all pending events, including any batch the worker is holding.
+
+        Args:
+            timeout: Maximum seconds to wait for the events to be sent
+        """
+        if self._worker_alive():
+            # The request is queued behind the pending events, so the worker
+            # sets it only after sending them (and its partial batch).
+            done = threading.Event()
+            try:
+                self._queue.put(done, timeout=timeout)
+            except queue.Full:
+                logger.debug("Telemetry queue full; flush request not delivered")
+                return
+            done.wait(timeout)
+            return
+
+        # No worker: send on the calling thread. Each batch is its own list
+        # handed straight to the sender, so the queue is never copied into one
+        # large list and then sliced. Only the events pending now are flushed,
+        # so busy producers cannot keep it looping.
+        batch_size = max(1, self.batch_size)
+        pending = self._queue.qsize()
+        while pending > 0:
+            batch = self._drain_queue(min(batch_size, pending))
+            if not batch:
+                return
+            pending -= len(batch)
+            self._flush_events(batch)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        Send pending events, stop the background worker and close the HTTP client.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker to finish
+        """
+        atexit.unregister(self.close)
+        # Nothing sends events queued after this point
+        self.enabled = False
+        if self._worker_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.debug("Telemetry queue full; stop request not delivered")
+            self._worker.join(timeout)
+        else:
+            self.flush(timeout)
+        if self._worker_alive():
+            # Still sending: leave the client to the daemon worker rather than
+            # closing it underneath an in-flight request
+            return
+        if self._client is not None:
+            self._client.close()
+            self._client = None
     
     def set_user_properties(self, user_id: str, properties: Dict[str, Any]) -> None:
         """
@@ -185,7 +338,7 @@ class TelemetryManager:
                 "version": "1.1.5",
             }
             
-            self.events.append(event)
+            self._enqueue(event)
             
         except Exception as e:
             logger.error(f"Failed to set user properties: {e}")
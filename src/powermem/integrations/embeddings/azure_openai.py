@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import AzureOpenAI
@@ -8,6 +8,9 @@ from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
 SCOPE = "https://cognitiveservices.azure.com/.default"
 
+# Maximum number of inputs the embeddings endpoint accepts per request
+MAX_INPUTS_PER_REQUEST = 2048
+
 
 class AzureOpenAIEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -55,3 +58,15 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         if self.config.embedding_dims:
             kwargs["dimensions"] = self.config.embedding_dims
         return self.client.embeddings.create(**kwargs).data[0].embedding
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None) -> List[List[float]]:
+        """Get embeddings for multiple texts using one API call per MAX_INPUTS_PER_REQUEST texts."""
+        cleaned = [t.replace("\n", " ") for t in texts]
+        kwargs: dict = {"model": self.config.model}
+        if self.config.embedding_dims:
+            kwargs["dimensions"] = self.config.embedding_dims
+        embeddings: List[List[float]] = []
+        for start in range(0, len(cleaned), MAX_INPUTS_PER_REQUEST):
+            response = self.client.embeddings.create(input=cleaned[start:start + MAX_INPUTS_PER_REQUEST], **kwargs)
+            embeddings.extend(item.embedding for item in sorted(response.data, key=lambda x: x.index))
+        return embeddings
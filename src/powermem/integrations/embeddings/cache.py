@@ -0,0 +1,105 @@
+"""
+In-process embedding cache
+
+Wraps an embedding service with a bounded LRU + TTL cache so identical
+content is not sent to the embedding backend again within the TTL window.
+"""
+
+import hashlib
+import logging
+from typing import Any, List, Literal, Optional
+
+from powermem.utils.cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+# "add" and "update" both embed stored documents and every provider maps them
+# to the same embedding type, so they share one cache bucket. "search" (query
+# embeddings) and None stay separate because providers such as Qwen or Vertex
+# AI return different vectors for them.
+_ACTION_BUCKETS = {"add": b"document|", "update": b"document|", "search": b"query|"}
+
+
+class EmbeddingCache(LRUTTLCache):
+    """LRU + TTL cache for embedding vectors, keyed by a digest of the text."""
+
+    @staticmethod
+    def make_key(text: str, memory_action: Optional[str]) -> bytes:
+        # Feed the pre-encoded bucket prefix and the text separately so the
+        # (possibly long) text is encoded once and never copied into a
+        # concatenated string first.
+        digest = hashlib.sha256(_ACTION_BUCKETS.get(memory_action, b"|"))
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+
+class CachedEmbedding:
+    """
+    Embedding service wrapper that serves repeated texts from an EmbeddingCache.
+
+    Only ``embed`` and ``embed_batch`` are intercepted; every other attribute
+    (``config``, provider-specific helpers, ...) is delegated to the wrapped
+    service. Cached vectors are returned as-is and must not be mutated.
+    """
+
+    def __init__(self, embedding: Any, maxsize: int = 1000, ttl: float = 3600):
+        self.embedding = embedding
+        self.cache = EmbeddingCache(maxsize=maxsize, ttl=ttl)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.embedding, name)
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        if not isinstance(text, str):
+            return self.embedding.embed(text, memory_action=memory_action)
+        key = self.cache.make_key(text, memory_action)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.embedding.embed(text, memory_action=memory_action)
+            self.cache.set(key, vector)
+        return vector
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None) -> List[Any]:
+        results: List[Any] = [None] * len(texts)
+        missing_keys: List[Optional[bytes]] = []
+        missing_indices: List[int] = []
+        for i, text in enumerate(texts):
+            key = self.cache.make_key(text, memory_action) if isinstance(text, str) else None
+            vector = self.cache.get(key) if key is not None else None
+            if vector is None:
+                missing_keys.append(key)
+                missing_indices.append(i)
+            else:
+                results[i] = vector
+
+        if missing_indices:
+            vectors = self.embedding.embed_batch(
+                [texts[i] for i in missing_indices], memory_action=memory_action
+            )
+            for i, key, vector in zip(missing_indices, missing_keys, vectors):
+                results[i] = vector
+                if key is not None:
+                    self.cache.set(key, vector)
+            logger.debug(
+                f"Embedding cache: {len(texts) - len(missing_indices)} hits, {len(missing_indices)} misses"
+            )
+        return results
+
+
+class CachedSparseEmbedding(CachedEmbedding):
+    """
+    Sparse embedding service wrapper that serves repeated texts from an EmbeddingCache.
+
+    Intercepts ``embed_sparse``; the cached ``{token_id: weight}`` dicts are
+    returned as-is and must not be mutated.
+    """
+
+    def embed_sparse(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        if not isinstance(text, str):
+            return self.embedding.embed_sparse(text, memory_action=memory_action)
+        key = self.cache.make_key(text, memory_action)
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.embedding.embed_sparse(text, memory_action=memory_action)
+            self.cache.set(key, vector)
+        return vector
@@ -10,6 +10,25 @@ from powermem.integrations.embeddings.config.providers import (
     CustomEmbeddingConfig,
 )
 
+# Providers accepted even before their config class has registered itself
+_BUILTIN_PROVIDERS = frozenset({
+    "openai",
+    "ollama",
+    "huggingface",
+    "azure_openai",
+    "gemini",
+    "vertexai",
+    "together",
+    "lmstudio",
+    "langchain",
+    "aws_bedrock",
+    "qwen",
+    "siliconflow",
+    "zai",
+    "ob_mass",
+    "mock",
+})
+
 
 class EmbedderConfig(BaseSettings):
     model_config = settings_config()
@@ -32,23 +51,7 @@ class EmbedderConfig(BaseSettings):
             return v
         if not isinstance(v, dict):
             raise ValueError("config must be a dict or BaseEmbedderConfig")
-        initialized_providers = [
-            "openai",
-            "ollama",
-            "huggingface",
-            "azure_openai",
-            "gemini",
-            "vertexai",
-            "together",
-            "lmstudio",
-            "langchain",
-            "aws_bedrock",
-            "qwen",
-            "siliconflow",
-            "zai",
-            "ob_mass",
-        ]
-        if provider in initialized_providers or BaseEmbedderConfig.has_provider(provider) or provider == "mock":
+        if provider in _BUILTIN_PROVIDERS or BaseEmbedderConfig.has_provider(provider):
             config_cls = (
                 BaseEmbedderConfig.get_provider_config_cls(provider)
                 or CustomEmbeddingConfig
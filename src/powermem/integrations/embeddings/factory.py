@@ -5,68 +5,54 @@ This module provides a factory for creating different embedding instances.
 """
 
 import importlib
+from functools import lru_cache
 from typing import Optional
 
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 from powermem.integrations.embeddings.config.providers import CustomEmbeddingConfig
-from powermem.integrations.embeddings.mock import MockEmbeddings
 
 
+@lru_cache(maxsize=None)
 def load_class(class_type):
+    # Cached per dotted path: after the first call the class is returned
+    # without going through the import machinery. Failed imports are not cached.
     module_path, class_name = class_type.rsplit(".", 1)
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
 
 
+def _config_value(config, key: str, default):
+    """Read ``key`` from a dict or config object, falling back to ``default`` when unset."""
+    if not config:
+        return default
+    if isinstance(config, dict):
+        value = config.get(key, default)
+    else:
+        value = getattr(config, key, default)
+    return default if value is None else value
+
+
+def _mock_dimension(config, vector_config) -> int:
+    # The embedder's embedding_dims wins over the vector store's embedding_model_dims
+    return _config_value(
+        config, "embedding_dims", _config_value(vector_config, "embedding_model_dims", 1536)
+    )
+
+
 class EmbedderFactory:
     @classmethod
     def create(cls, provider_name, config, vector_config: Optional[dict]):
-        # Helper function to extract dimension from vector_config (handles both dict and object)
-        def get_dimension_from_vector_config(vector_config, default=1536):
-            if not vector_config:
-                return default
-            if isinstance(vector_config, dict):
-                value = vector_config.get('embedding_model_dims', default)
-                return default if value is None else value
-            value = getattr(vector_config, 'embedding_model_dims', default)
-            return default if value is None else value
-
-        # Helper function to extract dimension from embedder config (handles dict and BaseSettings)
-        def get_dimension_from_embedder_config(embedder_config, default=1536):
-            if not embedder_config:
-                return default
-            if isinstance(embedder_config, dict):
-                value = embedder_config.get('embedding_dims', default)
-                return default if value is None else value
-            value = getattr(embedder_config, 'embedding_dims', default)
-            return default if value is None else value
-        
         # Handle none provider directly (embedding disabled)
         if provider_name == "none":
             from powermem.integrations.embeddings.noop import NoopEmbedding
             return NoopEmbedding()
 
         # Handle mock provider directly
-        if provider_name == "mock":
-            # Extract dimension from vector_config or embedder config, default to 1536
-            dimension = 1536  # Default dimension
-            dimension = get_dimension_from_vector_config(vector_config, dimension)
-            dimension = get_dimension_from_embedder_config(config, dimension)
-            return MockEmbeddings(dimension=dimension)
-        if provider_name == "upstash_vector" and vector_config:
-            # Check enable_embeddings (handles both dict and object)
-            enable_embeddings = False
-            if isinstance(vector_config, dict):
-                enable_embeddings = vector_config.get('enable_embeddings', False)
-            else:
-                enable_embeddings = getattr(vector_config, 'enable_embeddings', False)
-            
-            if enable_embeddings:
-                # Extract dimension from vector_config or embedder config, default to 1536
-                dimension = 1536  # Default dimension
-                dimension = get_dimension_from_vector_config(vector_config, dimension)
-                dimension = get_dimension_from_embedder_config(config, dimension)
-                return MockEmbeddings(dimension=dimension)
+        if provider_name == "mock" or (
+            provider_name == "upstash_vector" and _config_value(vector_config, "enable_embeddings", False)
+        ):
+            from powermem.integrations.embeddings.mock import MockEmbeddings
+            return MockEmbeddings(dimension=_mock_dimension(config, vector_config))
         class_type = BaseEmbedderConfig.get_provider_class_path(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from powermem.integrations.embeddings.base import EmbeddingBase
 
@@ -13,6 +13,7 @@ class MockEmbeddings(EmbeddingBase):
                       common embedding models and OceanBase default.
         """
         self.dimension = dimension
+        self._vector: List[float] = []
     
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -20,10 +21,10 @@ class MockEmbeddings(EmbeddingBase):
         
         Returns a vector with values [0.1, 0.2, 0.3, ...] repeated to fill the dimension.
         """
-        # Generate a simple pattern that repeats to fill the dimension
-        base_values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-        # Repeat the pattern to fill the required dimension
-        result = []
-        for i in range(self.dimension):
-            result.append(base_values[i % len(base_values)])
-        return result
+        # The vector is deterministic, so it is built once per dimension;
+        # callers get their own copy in case they modify it
+        if len(self._vector) != self.dimension:
+            base_values = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+            repeats, remainder = divmod(self.dimension, len(base_values))
+            self._vector = list(base_values * repeats + base_values[:remainder])
+        return self._vector.copy()
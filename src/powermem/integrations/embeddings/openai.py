@@ -7,6 +7,9 @@ from openai import OpenAI
 from powermem.integrations.embeddings.base import EmbeddingBase
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
+# Maximum number of inputs the embeddings endpoint accepts per request
+MAX_INPUTS_PER_REQUEST = 2048
+
 
 class OpenAIEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -55,14 +58,17 @@ class OpenAIEmbedding(EmbeddingBase):
     def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None) -> List[List[float]]:
         """Get embeddings for multiple texts in a single batch using OpenAI.
 
-        Uses one API call for all texts, which is significantly faster than
-        calling embed() sequentially.
+        Uses one API call per MAX_INPUTS_PER_REQUEST texts, which is
+        significantly faster than calling embed() sequentially.
         """
         cleaned = [t.replace("\n", " ") for t in texts]
-        kwargs = {"input": cleaned, "model": self.config.model}
+        kwargs = {"model": self.config.model}
         pass_dims = getattr(self.config, "pass_dimensions", True)
         if pass_dims:
             kwargs["dimensions"] = self.config.embedding_dims
-        response = self.client.embeddings.create(**kwargs)
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        return [item.embedding for item in sorted_data]
+        embeddings: List[List[float]] = []
+        for start in range(0, len(cleaned), MAX_INPUTS_PER_REQUEST):
+            response = self.client.embeddings.create(input=cleaned[start:start + MAX_INPUTS_PER_REQUEST], **kwargs)
+            sorted_data = sorted(response.data, key=lambda x: x.index)
+            embeddings.extend(item.embedding for item in sorted_data)
+        return embeddings
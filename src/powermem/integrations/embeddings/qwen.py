@@ -1,10 +1,12 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 try:
+    import dashscope
     from dashscope import TextEmbedding, MultiModalEmbedding, MultiModalEmbeddingItemText
     from dashscope.api_entities.dashscope_response import DashScopeAPIResponse
 except ImportError:
+    dashscope = None
     TextEmbedding = None
     MultiModalEmbedding = None
     MultiModalEmbeddingItemText = None
@@ -13,6 +15,12 @@ except ImportError:
 from powermem.integrations.embeddings.base import EmbeddingBase
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
+# Maximum number of texts the DashScope TextEmbedding API accepts per request
+MAX_INPUTS_PER_REQUEST = 10
+
+# Default DashScope text_type for each memory action, overridable per action in the config
+_ACTION_TO_TYPE = {"add": "document", "search": "query", "update": "document"}
+
 
 class QwenEmbedding(EmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
@@ -41,7 +49,7 @@ class QwenEmbedding(EmbeddingBase):
             or "https://dashscope.aliyuncs.com/api/v1"
         )
         if base_url:
-            os.environ["DASHSCOPE_BASE_URL"] = base_url
+            dashscope.base_http_api_url = base_url
 
     def _is_vl_model(self) -> bool:
         """Check if the configured model is a VL (vision-language) multimodal model.
@@ -79,24 +87,52 @@ class QwenEmbedding(EmbeddingBase):
             return response.output['embeddings'][0]['embedding']
         return response.output.get('embeddings', [{}])[0].get('embedding', [])
 
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None) -> List[List[float]]:
+        """Get embeddings for multiple texts, one API call per MAX_INPUTS_PER_REQUEST texts.
+
+        VL models go through the MultiModalEmbedding API one text at a time.
+        """
+        if self._is_vl_model():
+            return super().embed_batch(texts, memory_action)
+
+        cleaned = [t.replace("\n", " ").strip() for t in texts]
+        params = {
+            "model": self.config.model,
+            "text_type": self._embedding_type(memory_action),
+        }
+        if self.config.embedding_dims:
+            params["dimension"] = self.config.embedding_dims
+
+        embeddings: List[List[float]] = []
+        for start in range(0, len(cleaned), MAX_INPUTS_PER_REQUEST):
+            try:
+                response = TextEmbedding.call(
+                    api_key=self.api_key, input=cleaned[start:start + MAX_INPUTS_PER_REQUEST], **params
+                )
+            except Exception as e:
+                raise Exception(f"Failed to generate embeddings: {e}")
+            if response.status_code != 200:
+                raise Exception(f"API request failed with status {response.status_code}: {response.message}")
+            items = sorted(response.output['embeddings'], key=lambda item: item['text_index'])
+            embeddings.extend(item['embedding'] for item in items)
+        return embeddings
+
+    def _embedding_type(self, memory_action: Optional[Literal["add", "search", "update"]] = None) -> str:
+        """Map a memory action to the DashScope text_type (query or document)."""
+        default = _ACTION_TO_TYPE.get(memory_action)
+        if default is None:
+            return "document"
+        return getattr(self.config, f"memory_{memory_action}_embedding_type", None) or default
+
     def _embed_text(self, text: str, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """Embed text using the standard TextEmbedding API (text-only models)."""
-        if memory_action == "add":
-            embedding_type = getattr(self.config, "memory_add_embedding_type", None) or "document"
-        elif memory_action == "search":
-            embedding_type = getattr(self.config, "memory_search_embedding_type", None) or "query"
-        elif memory_action == "update":
-            embedding_type = getattr(self.config, "memory_update_embedding_type", None) or "document"
-        else:
-            embedding_type = "document"
-
         try:
             params = {
                 "model": self.config.model,
                 "input": text,
-                "text_type": embedding_type,
+                "text_type": self._embedding_type(memory_action),
             }
-            if hasattr(self.config, 'embedding_dims') and self.config.embedding_dims:
+            if self.config.embedding_dims:
                 params["dimension"] = self.config.embedding_dims
 
             response = TextEmbedding.call(api_key=self.api_key, **params)
@@ -122,7 +158,7 @@ class QwenEmbedding(EmbeddingBase):
                 "model": self.config.model,
                 "input": input_items,
             }
-            if hasattr(self.config, 'embedding_dims') and self.config.embedding_dims:
+            if self.config.embedding_dims:
                 params["dimension"] = self.config.embedding_dims
 
             response = MultiModalEmbedding.call(api_key=self.api_key, **params)
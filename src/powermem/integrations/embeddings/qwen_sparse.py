@@ -5,12 +5,16 @@ from powermem.integrations.embeddings.config.sparse_base import BaseSparseEmbedd
 from powermem.integrations.embeddings.sparse_base import SparseEmbeddingBase
 
 try:
+    import dashscope
     from dashscope import TextEmbedding
     from dashscope.api_entities.dashscope_response import DashScopeAPIResponse
 except ImportError:
+    dashscope = None
     TextEmbedding = None
     DashScopeAPIResponse = None
-import dashscope
+
+# DashScope text_type for each memory action
+_ACTION_TO_TYPE = {"add": "document", "search": "query", "update": "document"}
 
 
 class QwenSparseEmbedding(SparseEmbeddingBase):
@@ -43,7 +47,7 @@ class QwenSparseEmbedding(SparseEmbeddingBase):
             or "https://dashscope.aliyuncs.com/api/v1"
         )
         if base_url:
-            os.environ["DASHSCOPE_BASE_URL"] = base_url
+            dashscope.base_http_api_url = base_url
 
     def embed_sparse(self, text: str, memory_action: Optional[Literal["add", "search", "update"]] = None) -> dict[int, float]:
         """
@@ -58,31 +62,19 @@ class QwenSparseEmbedding(SparseEmbeddingBase):
         # Clean text
         text = text.replace("\n", " ").strip()
 
-        # Determine embedding type based on memory action
-        if memory_action == "add":
-            embedding_type = "document"
-        elif memory_action == "search":
-            embedding_type =  "query"
-        elif memory_action == "update":
-            embedding_type = "document"
-        else:
-            # Default to "document" if memory_action is None or unknown
-            embedding_type = "document"
-
         try:
             params = {
                 "model": self.config.model,
                 "input": text,
                 "output_type": "sparse",
+                # Embedding type from the memory action ("document" if None or unknown)
+                "text_type": _ACTION_TO_TYPE.get(memory_action, "document"),
             }
 
             # Add dimension parameter if specified
-            if hasattr(self.config, 'embedding_dims') and self.config.embedding_dims:
+            if self.config.embedding_dims:
                 params["dimension"] = self.config.embedding_dims
 
-            # Add embedding type (always set, either from config or default)
-            params["text_type"] = embedding_type
-
             # Call the API
             response = TextEmbedding.call(**params)
 
@@ -1,11 +1,14 @@
 import os
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from openai import OpenAI
 
 from powermem.integrations.embeddings.base import EmbeddingBase
 from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
 
+# Maximum number of inputs SiliconFlow's embeddings endpoint accepts per request
+MAX_INPUTS_PER_REQUEST = 32
+
 
 class SiliconFlowEmbedding(EmbeddingBase):
     """
@@ -61,3 +64,19 @@ class SiliconFlowEmbedding(EmbeddingBase):
 
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
 
+    def embed_batch(
+        self,
+        texts: List[str],
+        memory_action: Optional[Literal["add", "search", "update"]] = None,
+    ) -> List[List[float]]:
+        """Get embeddings for multiple texts, one API call per MAX_INPUTS_PER_REQUEST texts."""
+        cleaned = [t.replace("\n", " ") for t in texts]
+        kwargs = {"model": self.config.model}
+        if self.config.embedding_dims:
+            kwargs["dimensions"] = self.config.embedding_dims
+        embeddings: List[List[float]] = []
+        for start in range(0, len(cleaned), MAX_INPUTS_PER_REQUEST):
+            response = self.client.embeddings.create(input=cleaned[start:start + MAX_INPUTS_PER_REQUEST], **kwargs)
+            sorted_data = sorted(response.data, key=lambda x: x.index)
+            embeddings.extend(item.embedding for item in sorted_data)
+        return embeddings
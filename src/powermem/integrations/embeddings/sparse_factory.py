@@ -5,11 +5,15 @@ This module provides a factory for creating different sparse embedding backends.
 """
 
 import importlib
+from functools import lru_cache
 
 from powermem.integrations.embeddings.config.sparse_base import BaseSparseEmbedderConfig
 
 
+@lru_cache(maxsize=None)
 def load_class(class_type):
+    # Cached per dotted path: after the first call the class is returned
+    # without going through the import machinery. Failed imports are not cached.
     module_path, class_name = class_type.rsplit(".", 1)
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
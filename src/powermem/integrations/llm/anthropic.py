@@ -20,17 +20,7 @@ class AnthropicLLM(LLMBase):
             config = AnthropicConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, AnthropicConfig):
             # Convert BaseLLMConfig to AnthropicConfig
-            config = AnthropicConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = AnthropicConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
@@ -89,6 +79,13 @@ class AnthropicLLM(LLMBase):
             else:
                 filtered_messages.append(message)
 
+        if system_message and getattr(self.config, "prompt_caching", False):
+            # The extraction/update system prompts are identical across calls, so
+            # let Anthropic serve them from its prompt cache
+            system_message = [
+                {"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}
+            ]
+
         params = self._get_supported_params(messages=messages, **kwargs)
         # Anthropic API rejects requests where both temperature and top_p are set.
         # Keep temperature (more common); drop top_p.
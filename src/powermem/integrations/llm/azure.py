@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
@@ -8,19 +9,65 @@ logger = logging.getLogger(__name__)
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.azure import AzureOpenAIConfig
 from powermem.integrations.llm.config.base import BaseLLMConfig
-from powermem.utils.utils import extract_json
+from powermem.utils.utils import loads_tool_arguments
 
 try:
     from openai import AzureOpenAI
-    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 except ImportError:
-    raise ImportError(
-        "The 'openai' and 'azure-identity' libraries are required. "
-        "Please install them using 'pip install openai azure-identity'."
+    raise ImportError("The 'openai' library is required. Please install it using 'pip install openai'.")
+
+# Token scope used with DefaultAzureCredential when no API key is configured
+_COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+
+@lru_cache(maxsize=1)
+def _default_token_provider():
+    # Building DefaultAzureCredential walks the whole credential chain. The
+    # bearer token provider caches its token and refreshes it before expiry,
+    # so one per process is enough. Failures are not cached. azure-identity is
+    # only needed on this keyless path, so it is imported here.
+    try:
+        from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+    except ImportError:
+        raise ImportError(
+            "The 'azure-identity' library is required for Azure AD authentication. "
+            "Please install it using 'pip install azure-identity', or provide an API key."
+        )
+    return get_bearer_token_provider(DefaultAzureCredential(), _COGNITIVE_SERVICES_SCOPE)
+
+
+# Bound on cached clients, so processes cycling through many API keys do not
+# keep every key and connection pool alive
+_CLIENT_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=_CLIENT_CACHE_SIZE)
+def _build_client(azure_endpoint: str, api_version: str, api_key: Optional[str] = None) -> "AzureOpenAI":
+    """
+    Return the shared AzureOpenAI client for an endpoint/version/key, keeping its connection pool warm.
+
+    The client is shared by every AzureLLM with the same settings, so callers
+    must not close it.
+    """
+    if api_key:
+        return AzureOpenAI(azure_endpoint=azure_endpoint, api_key=api_key, api_version=api_version)
+    return AzureOpenAI(
+        azure_endpoint=azure_endpoint,
+        azure_ad_token_provider=_default_token_provider(),
+        api_version=api_version,
     )
 
 
 class AzureLLM(LLMBase):
+    """
+    Azure OpenAI chat completions.
+
+    Unless an ``azure_ad_token_provider`` is configured, ``client`` is shared
+    with other AzureLLM instances using the same endpoint, API version and
+    key. Do not close it; it is released once it is evicted from the client
+    cache and no instance holds it.
+    """
+
     def __init__(self, config: Optional[Union[BaseLLMConfig, AzureOpenAIConfig, Dict]] = None):
         # Convert to AzureOpenAIConfig if needed
         if config is None:
@@ -29,17 +76,7 @@ class AzureLLM(LLMBase):
             config = AzureOpenAIConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, AzureOpenAIConfig):
             # Convert BaseLLMConfig to AzureOpenAIConfig
-            config = AzureOpenAIConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = AzureOpenAIConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
@@ -82,15 +119,7 @@ class AzureLLM(LLMBase):
             if not api_key:
                 # Try to use DefaultAzureCredential if no API key is provided
                 try:
-                    token_provider = get_bearer_token_provider(
-                        DefaultAzureCredential(),
-                        "https://cognitiveservices.azure.com/.default"
-                    )
-                    self.client = AzureOpenAI(
-                        azure_endpoint=azure_endpoint,
-                        azure_ad_token_provider=token_provider,
-                        api_version=api_version,
-                    )
+                    self.client = _build_client(azure_endpoint, api_version)
                 except Exception as e:
                     raise ValueError(
                         f"Either api_key or azure_ad_token_provider must be provided. "
@@ -98,11 +127,7 @@ class AzureLLM(LLMBase):
                         f"Attempted to use DefaultAzureCredential but failed: {e}"
                     )
             else:
-                self.client = AzureOpenAI(
-                    azure_endpoint=azure_endpoint,
-                    api_key=api_key,
-                    api_version=api_version,
-                )
+                self.client = _build_client(azure_endpoint, api_version, api_key)
 
     def _parse_response(self, response, tools):
         """
@@ -115,44 +140,34 @@ class AzureLLM(LLMBase):
         Returns:
             str or dict: The processed response.
         """
-        if tools:
-            processed_response = {
-                "content": response.choices[0].message.content,
-                "tool_calls": [],
-            }
-
-            if response.choices[0].message.tool_calls:
-                for tool_call in response.choices[0].message.tool_calls:
-                    # Extract and validate arguments
-                    arguments_str = extract_json(tool_call.function.arguments)
-
-                    # Check if arguments are empty or whitespace only
-                    if not arguments_str or arguments_str.strip() == "":
-                        logger.warning(
-                            f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
-                        )
-                        continue
-
-                    # Try to parse JSON with error handling
-                    try:
-                        arguments = json.loads(arguments_str)
-                    except json.JSONDecodeError as e:
-                        logger.error(
-                            f"Failed to parse tool call arguments for '{tool_call.function.name}': "
-                            f"{arguments_str[:100]}... Error: {e}"
-                        )
-                        continue
-
-                    processed_response["tool_calls"].append(
-                        {
-                            "name": tool_call.function.name,
-                            "arguments": arguments,
-                        }
-                    )
+        message = response.choices[0].message
+        if not tools:
+            return message.content
+
+        tool_calls = []
+        for tool_call in message.tool_calls or ():
+            arguments_str = tool_call.function.arguments
+
+            # Check if arguments are empty or whitespace only
+            if not arguments_str or arguments_str.strip() == "":
+                logger.warning(
+                    f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
+                )
+                continue
 
-            return processed_response
-        else:
-            return response.choices[0].message.content
+            # Try to parse JSON with error handling
+            try:
+                arguments = loads_tool_arguments(arguments_str)
+            except json.JSONDecodeError as e:
+                logger.error(
+                    f"Failed to parse tool call arguments for '{tool_call.function.name}': "
+                    f"{arguments_str[:100]}... Error: {e}"
+                )
+                continue
+
+            tool_calls.append({"name": tool_call.function.name, "arguments": arguments})
+
+        return {"content": message.content, "tool_calls": tool_calls}
 
     def generate_response(
         self,
@@ -176,13 +191,8 @@ class AzureLLM(LLMBase):
             json: The generated response.
         """
         params = self._get_supported_params(messages=messages, **kwargs)
-
-        params.update(
-            {
-                "model": self.config.model,
-                "messages": messages,
-            }
-        )
+        params["model"] = self.config.model
+        params["messages"] = messages
 
         if response_format:
             params["response_format"] = response_format
@@ -0,0 +1,64 @@
+"""
+In-process LLM response cache
+
+Wraps an LLM with a bounded LRU + TTL cache so an identical request (same
+model, messages, response format and tools) is answered without another
+API round trip within the TTL window. Opt-in: only worthwhile when callers
+re-issue identical prompts (e.g. fact-extraction retries) and can accept a
+repeated answer for sampled (temperature > 0) completions.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from powermem.utils.cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM:
+    """
+    LLM wrapper that serves repeated requests from an LRUTTLCache.
+
+    Only ``generate_response`` is intercepted; every other attribute
+    (``config``, ``is_noop``, provider-specific helpers, ...) is delegated to
+    the wrapped LLM. Cached dict responses are copied on the way out so
+    callers can mutate them freely.
+    """
+
+    def __init__(self, llm: Any, maxsize: int = 512, ttl: float = 3600):
+        self.llm = llm
+        self.cache = LRUTTLCache(maxsize=maxsize, ttl=ttl)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+    def _make_key(self, messages, response_format, tools, tool_choice, kwargs: Dict[str, Any]) -> bytes:
+        model = getattr(getattr(self.llm, "config", None), "model", None)
+        request = [model, messages, response_format, tools, tool_choice if tools else None, kwargs]
+        # default=str keeps non-JSON values (e.g. pydantic response formats) hashable
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        key = self._make_key(messages, response_format, tools, tool_choice, kwargs)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.llm.generate_response(
+                messages, response_format=response_format, tools=tools, tool_choice=tool_choice, **kwargs
+            )
+            if response is not None:
+                self.cache.set(key, response)
+        else:
+            logger.debug("LLM response cache hit")
+        return copy.deepcopy(response) if isinstance(response, (dict, list)) else response
@@ -48,3 +48,11 @@ class AnthropicConfig(BaseLLMConfig):
         ),
         description="Anthropic API base URL"
     )
+
+    prompt_caching: bool = Field(
+        default=False,
+        description=(
+            "Mark the system prompt as a cacheable prefix (Anthropic prompt caching). "
+            "Prompts below the model's minimum cacheable length are sent uncached."
+        )
+    )
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import Any, ClassVar, Dict, Optional, Union
 
 import httpx
@@ -6,6 +7,19 @@ from pydantic_settings import BaseSettings
 
 from powermem.settings import settings_config
 
+# Settings shared by every provider config, copied over by to_provider_kwargs()
+_COMMON_FIELDS = (
+    "model",
+    "temperature",
+    "api_key",
+    "max_tokens",
+    "top_p",
+    "top_k",
+    "enable_vision",
+    "vision_details",
+)
+_get_common_fields = attrgetter(*_COMMON_FIELDS)
+
 
 class BaseLLMConfig(BaseSettings):
     """
@@ -127,6 +141,17 @@ class BaseLLMConfig(BaseSettings):
         if self.http_client_proxies and not self.http_client:
             self.http_client = httpx.Client(proxies=self.http_client_proxies)
 
+    def to_provider_kwargs(self) -> Dict[str, Any]:
+        """
+        Return the common settings as keyword arguments for a provider config class.
+
+        Used by LLM providers to convert a plain BaseLLMConfig into their own
+        config type.
+        """
+        kwargs = dict(zip(_COMMON_FIELDS, _get_common_fields(self)))
+        kwargs["http_client_proxies"] = self.http_client
+        return kwargs
+
     def to_component_dict(self) -> Dict[str, Any]:
         """
         Convert config to component dictionary format.
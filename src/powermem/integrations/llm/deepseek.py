@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Dict, List, Optional, Union
 
@@ -6,7 +5,7 @@ from openai import OpenAI
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.base import BaseLLMConfig
 from powermem.integrations.llm.config.deepseek import DeepSeekConfig
-from powermem.utils.utils import extract_json
+from powermem.utils.utils import loads_tool_arguments
 
 
 class DeepSeekLLM(LLMBase):
@@ -18,17 +17,7 @@ class DeepSeekLLM(LLMBase):
             config = DeepSeekConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, DeepSeekConfig):
             # Convert BaseLLMConfig to DeepSeekConfig
-            config = DeepSeekConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = DeepSeekConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
@@ -61,7 +50,7 @@ class DeepSeekLLM(LLMBase):
                     processed_response["tool_calls"].append(
                         {
                             "name": tool_call.function.name,
-                            "arguments": json.loads(extract_json(tool_call.function.arguments)),
+                            "arguments": loads_tool_arguments(tool_call.function.arguments),
                         }
                     )
 
@@ -1,4 +1,5 @@
 import importlib
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
 from powermem.integrations.llm.config.anthropic import AnthropicConfig
@@ -18,7 +19,10 @@ from powermem.integrations.llm.config.vllm import VllmConfig
 from powermem.integrations.llm.config.zai import ZaiConfig
 
 
+@lru_cache(maxsize=None)
 def load_class(class_type):
+    # Cached per dotted path: after the first call the class is returned
+    # without going through the import machinery. Failed imports are not cached.
     module_path, class_name = class_type.rsplit(".", 1)
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
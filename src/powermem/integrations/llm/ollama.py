@@ -19,17 +19,7 @@ class OllamaLLM(LLMBase):
             config = OllamaConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, OllamaConfig):
             # Convert BaseLLMConfig to OllamaConfig
-            config = OllamaConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = OllamaConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
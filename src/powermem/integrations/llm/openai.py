@@ -9,7 +9,7 @@ from openai import OpenAI
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.base import BaseLLMConfig
 from powermem.integrations.llm.config.openai import OpenAIConfig
-from powermem.utils.utils import extract_json
+from powermem.utils.utils import loads_tool_arguments
 
 
 def _chat_message_content_to_str(content: Any) -> str:
@@ -42,15 +42,7 @@ class OpenAILLM(LLMBase):
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, OpenAIConfig):
             # Convert BaseLLMConfig to OpenAIConfig
             config = OpenAIConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
+                **config.to_provider_kwargs(),
                 default_headers=getattr(config, "default_headers", None),
             )
 
@@ -61,7 +53,9 @@ class OpenAILLM(LLMBase):
 
         default_headers = getattr(self.config, "default_headers", None)
 
-        if os.environ.get("OPENROUTER_API_KEY"):  # Use OpenRouter
+        # Decided once so request parameters always match the client built here
+        self._use_openrouter = bool(os.environ.get("OPENROUTER_API_KEY"))
+        if self._use_openrouter:  # Use OpenRouter
             client_kwargs = {
                 "api_key": os.environ.get("OPENROUTER_API_KEY"),
                 "base_url": getattr(self.config, "openrouter_base_url", None)
@@ -91,44 +85,34 @@ class OpenAILLM(LLMBase):
         Returns:
             str or dict: The processed response.
         """
-        if tools:
-            processed_response = {
-                "content": _chat_message_content_to_str(response.choices[0].message.content),
-                "tool_calls": [],
-            }
+        message = response.choices[0].message
+        if not tools:
+            return _chat_message_content_to_str(message.content)
+
+        tool_calls = []
+        for tool_call in message.tool_calls or ():
+            arguments_str = tool_call.function.arguments
+
+            # Check if arguments are empty or whitespace only
+            if not arguments_str or arguments_str.strip() == "":
+                logger.warning(
+                    f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
+                )
+                continue
+
+            # Try to parse JSON with error handling
+            try:
+                arguments = loads_tool_arguments(arguments_str)
+            except json.JSONDecodeError as e:
+                logger.error(
+                    f"Failed to parse tool call arguments for '{tool_call.function.name}': "
+                    f"{arguments_str[:100]}... Error: {e}"
+                )
+                continue
 
-            if response.choices[0].message.tool_calls:
-                for tool_call in response.choices[0].message.tool_calls:
-                    # Extract and validate arguments
-                    arguments_str = extract_json(tool_call.function.arguments)
-
-                    # Check if arguments are empty or whitespace only
-                    if not arguments_str or arguments_str.strip() == "":
-                        logger.warning(
-                            f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
-                        )
-                        continue
-
-                    # Try to parse JSON with error handling
-                    try:
-                        arguments = json.loads(arguments_str)
-                    except json.JSONDecodeError as e:
-                        logger.error(
-                            f"Failed to parse tool call arguments for '{tool_call.function.name}': "
-                            f"{arguments_str[:100]}... Error: {e}"
-                        )
-                        continue
-
-                    processed_response["tool_calls"].append(
-                        {
-                            "name": tool_call.function.name,
-                            "arguments": arguments,
-                        }
-                    )
-
-            return processed_response
-        else:
-            return _chat_message_content_to_str(response.choices[0].message.content)
+            tool_calls.append({"name": tool_call.function.name, "arguments": arguments})
+
+        return {"content": _chat_message_content_to_str(message.content), "tool_calls": tool_calls}
 
     def generate_response(
         self,
@@ -158,7 +142,7 @@ class OpenAILLM(LLMBase):
             "messages": messages,
         })
 
-        if os.getenv("OPENROUTER_API_KEY"):
+        if self._use_openrouter:
             openrouter_params = {}
             models = getattr(self.config, "models", None)
             if models:
@@ -178,10 +162,8 @@ class OpenAILLM(LLMBase):
             params.update(**openrouter_params)
         
         else:
-            openai_specific_generation_params = ["store"]
-            for param in openai_specific_generation_params:
-                if hasattr(self.config, param):
-                    params[param] = getattr(self.config, param)
+            # OpenAI-specific generation params (the config is always an OpenAIConfig)
+            params["store"] = self.config.store
             
         if response_format:
             params["response_format"] = response_format
@@ -6,6 +6,7 @@ from openai import OpenAI
 
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.base import BaseLLMConfig
+from powermem.utils.utils import loads_json
 
 
 class OpenAIStructuredLLM(LLMBase):
@@ -65,7 +66,7 @@ class OpenAIStructuredLLM(LLMBase):
                 # Parse arguments if it's a string
                 if isinstance(arguments, str):
                     try:
-                        arguments = json.loads(arguments)
+                        arguments = loads_json(arguments)
                     except json.JSONDecodeError:
                         arguments = {}
 
@@ -1,4 +1,3 @@
-import json
 import logging
 import os
 from typing import Dict, List, Optional, Union
@@ -15,7 +14,7 @@ except ImportError:
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.base import BaseLLMConfig
 from powermem.integrations.llm.config.qwen import QwenConfig
-from powermem.utils.utils import extract_json
+from powermem.utils.utils import loads_tool_arguments
 
 
 class QwenLLM(LLMBase):
@@ -36,17 +35,7 @@ class QwenLLM(LLMBase):
             config = QwenConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, QwenConfig):
             # Convert BaseLLMConfig to QwenConfig
-            config = QwenConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = QwenConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
@@ -86,16 +75,14 @@ class QwenLLM(LLMBase):
         
         return None, text
     
-    def _extract_content(self, output):
+    def _extract_content(self, message, default_text):
         """Extract response content"""
-        message, default_text = self._extract_message(output)
         if message:
             return self._get_attr(message, 'content', default_text)
         return default_text
     
-    def _extract_tool_calls(self, output):
+    def _extract_tool_calls(self, message):
         """Extract tool calls from response"""
-        message, _ = self._extract_message(output)
         if not message:
             return []
         
@@ -111,7 +98,7 @@ class QwenLLM(LLMBase):
             
             processed_calls.append({
                 "name": name,
-                "arguments": json.loads(extract_json(arguments)),
+                "arguments": loads_tool_arguments(arguments),
             })
         
         return processed_calls
@@ -130,12 +117,14 @@ class QwenLLM(LLMBase):
         if response.status_code != 200:
             raise Exception(f"API request failed with status {response.status_code}: {response.message}")
 
-        content = self._extract_content(response.output)
+        # Locate the message once; content and tool calls are both read from it
+        message, default_text = self._extract_message(response.output)
+        content = self._extract_content(message, default_text)
         
         if tools:
             return {
                 "content": content,
-                "tool_calls": self._extract_tool_calls(response.output),
+                "tool_calls": self._extract_tool_calls(message),
             }
         
         return content
@@ -47,14 +47,14 @@ class QwenASR(LLMBase):
             self.config.model = "qwen3-asr-flash"
 
         # Set API key
-        api_key = self.config.api_key or os.getenv("DASHSCOPE_API_KEY")
-        if not api_key:
+        self.api_key = self.config.api_key or os.getenv("DASHSCOPE_API_KEY")
+        if not self.api_key:
             raise ValueError(
                 "API key is required. Set DASHSCOPE_API_KEY environment variable or pass api_key in config."
             )
 
         # Set API key for DashScope SDK
-        dashscope.api_key = api_key
+        dashscope.api_key = self.api_key
 
         # Set base URL
         base_url = getattr(self.config, "dashscope_base_url", None) or os.getenv(
@@ -81,8 +81,9 @@ class QwenASR(LLMBase):
             if choices:
                 content = choices[0].message.content
                 if content:
-                    # Extract all text fields from content list
-                    texts = [item["text"] for item in content if "text" in item]
+                    # Extract all text fields from content list (one lookup per segment;
+                    # a list, since str.join would build one from a generator anyway)
+                    texts = [text for item in content if (text := item.get("text")) is not None]
                     # Join all text segments
                     return " ".join(texts)
             return ""
@@ -118,7 +119,7 @@ class QwenASR(LLMBase):
         """
         # Prepare ASR parameters
         asr_params = {
-            "api_key": self.config.api_key or os.getenv("DASHSCOPE_API_KEY"),
+            "api_key": self.api_key,
             "model": self.config.model,
             "messages": messages,
             "result_format": getattr(self.config, "result_format", "message"),
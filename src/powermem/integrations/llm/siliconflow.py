@@ -9,7 +9,7 @@ from openai import OpenAI
 from powermem.integrations.llm import LLMBase
 from powermem.integrations.llm.config.base import BaseLLMConfig
 from powermem.integrations.llm.config.openai import OpenAIConfig
-from powermem.utils.utils import extract_json
+from powermem.utils.utils import loads_tool_arguments
 
 
 class SiliconFlowLLM(LLMBase):
@@ -28,17 +28,7 @@ class SiliconFlowLLM(LLMBase):
             config = OpenAIConfig(**config)
         elif isinstance(config, BaseLLMConfig) and not isinstance(config, OpenAIConfig):
             # Convert BaseLLMConfig to OpenAIConfig
-            config = OpenAIConfig(
-                model=config.model,
-                temperature=config.temperature,
-                api_key=config.api_key,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                top_k=config.top_k,
-                enable_vision=config.enable_vision,
-                vision_details=config.vision_details,
-                http_client_proxies=config.http_client,
-            )
+            config = OpenAIConfig(**config.to_provider_kwargs())
 
         super().__init__(config)
 
@@ -67,44 +57,34 @@ class SiliconFlowLLM(LLMBase):
         Returns:
             str or dict: The processed response.
         """
-        if tools:
-            processed_response = {
-                "content": response.choices[0].message.content,
-                "tool_calls": [],
-            }
-
-            if response.choices[0].message.tool_calls:
-                for tool_call in response.choices[0].message.tool_calls:
-                    # Extract and validate arguments
-                    arguments_str = extract_json(tool_call.function.arguments)
-
-                    # Check if arguments are empty or whitespace only
-                    if not arguments_str or arguments_str.strip() == "":
-                        logger.warning(
-                            f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
-                        )
-                        continue
-
-                    # Try to parse JSON with error handling
-                    try:
-                        arguments = json.loads(arguments_str)
-                    except json.JSONDecodeError as e:
-                        logger.error(
-                            f"Failed to parse tool call arguments for '{tool_call.function.name}': "
-                            f"{arguments_str[:100]}... Error: {e}"
-                        )
-                        continue
-
-                    processed_response["tool_calls"].append(
-                        {
-                            "name": tool_call.function.name,
-                            "arguments": arguments,
-                        }
-                    )
-
-            return processed_response
-        else:
-            return response.choices[0].message.content
+        message = response.choices[0].message
+        if not tools:
+            return message.content
+
+        tool_calls = []
+        for tool_call in message.tool_calls or ():
+            arguments_str = tool_call.function.arguments
+
+            # Check if arguments are empty or whitespace only
+            if not arguments_str or arguments_str.strip() == "":
+                logger.warning(
+                    f"Tool call '{tool_call.function.name}' has empty arguments. Skipping this tool call."
+                )
+                continue
+
+            # Try to parse JSON with error handling
+            try:
+                arguments = loads_tool_arguments(arguments_str)
+            except json.JSONDecodeError as e:
+                logger.error(
+                    f"Failed to parse tool call arguments for '{tool_call.function.name}': "
+                    f"{arguments_str[:100]}... Error: {e}"
+                )
+                continue
+
+            tool_calls.append({"name": tool_call.function.name, "arguments": arguments})
+
+        return {"content": message.content, "tool_calls": tool_calls}
 
     def generate_response(
         self,
@@ -4,13 +4,6 @@ Qwen Rerank implementation using Alibaba Cloud DashScope API
 import os
 from typing import List, Optional, Tuple
 
-try:
-    import dashscope
-    from dashscope import TextReRank
-except ImportError:
-    TextReRank = None
-    dashscope = None
-
 from powermem.integrations.rerank.base import RerankBase
 from powermem.integrations.rerank.config.base import BaseRerankConfig
 
@@ -31,11 +24,16 @@ class QwenRerank(RerankBase):
         if not self.config.model:
             self.config.model = "qwen3-rerank"
 
-        # Check if dashscope is available
-        if TextReRank is None or dashscope is None:
+        # Import the DashScope SDK only when this provider is used: the rerank
+        # package is imported with powermem, and the SDK is slow to load
+        try:
+            import dashscope
+            from dashscope import TextReRank
+        except ImportError:
             raise ImportError(
                 "DashScope SDK is not installed. Please install it with: pip install dashscope"
-            )
+            ) from None
+        self._text_rerank = TextReRank
 
         # Validate API key (config already handles env var loading)
         if not self.config.api_key:
@@ -91,7 +89,7 @@ class QwenRerank(RerankBase):
         try:
             # Call the Rerank API
             if instruct is not None:
-                response = TextReRank.call(
+                response = self._text_rerank.call(
                     model=self.config.model,
                     query=query,
                     documents=documents,
@@ -100,7 +98,7 @@ class QwenRerank(RerankBase):
                     instruct=instruct
                 )
             else:
-                response = TextReRank.call(
+                response = self._text_rerank.call(
                     model=self.config.model,
                     query=query,
                     documents=documents,
@@ -11,6 +11,7 @@ import logging
 from typing import Dict, Any, Optional, List
 from collections import defaultdict
 from powermem.prompts.optimization_prompts import MEMORY_COMPRESSION_PROMPT
+from powermem.utils.utils import generate_content_hash
 
 logger = logging.getLogger(__name__)
 
@@ -288,20 +289,21 @@ class MemoryOptimizer:
             memories = self.storage.get_all_memories(user_id=user_id, limit=10000)
             stats["total_checked"] = len(memories)
 
-            # Group by hash
+            # Group by hash. The hash is recomputed from content and owner
+            # rather than read from the record: rows stored before the switch
+            # from MD5 to BLAKE2b keep their old digest, so stored hashes of
+            # the same content would never match across that boundary (and
+            # get_all_memories does not return the hash at all). The stored
+            # hash is only used for records without content.
             hash_groups = defaultdict(list)
             for mem in memories:
-                # Use 'hash' field if available, otherwise compute it?
-                # The storage adapter's get_all_memories returns a dict that might not have 'hash'
-                # if it wasn't requested or stored. However, Memory.add stores a hash.
-                # Let's check if 'hash' is present. If not, we can fall back to hashing content.
-                content_hash = mem.get("hash")
-                if not content_hash:
-                    # Fallback if hash not present in record
-                    import hashlib
-                    content = mem.get("memory", "") or mem.get("content", "")
-                    if content:
-                        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+                content = mem.get("memory", "") or mem.get("content", "")
+                if content:
+                    content_hash = generate_content_hash(
+                        content, mem.get("user_id"), mem.get("agent_id")
+                    )
+                else:
+                    content_hash = mem.get("hash")
 
                 if content_hash:
                     hash_groups[content_hash].append(mem)
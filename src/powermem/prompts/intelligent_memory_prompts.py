@@ -159,12 +159,13 @@ def parse_messages_for_facts(messages: list) -> str:
     if not isinstance(messages, list):
         return str(messages)
     
-    conversation = ""
-    for msg in messages:
-        if isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-            role = msg['role']
-            content = msg['content']
-            if role != "system":  # Skip system messages
-                conversation += f"{role}: {content}\n"
-    
-    return conversation
+    # Single join instead of repeated string concatenation (quadratic on long
+    # conversations); system messages are skipped.
+    return "".join(
+        f"{msg['role']}: {msg['content']}\n"
+        for msg in messages
+        if isinstance(msg, dict)
+        and 'role' in msg
+        and 'content' in msg
+        and msg['role'] != "system"
+    )
@@ -5,16 +5,35 @@ This module provides an adapter that bridges the VectorStoreBase interface
 with the interface expected by the Memory class.
 """
 
+import functools
+import inspect
+import itertools
 import logging
 import uuid
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from powermem.storage.base import VectorStoreBase
 from powermem.utils.utils import serialize_datetime, get_current_datetime
 
 logger = logging.getLogger(__name__)
 
+# Process-wide counter so generations are never reused, even across adapters
+# (Memory.reset() replaces its adapter).
+_write_generations = itertools.count(1)
+
+
+def _records_write(method):
+    """Advance ``write_generation`` after a (possibly failed) write."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.write_generation = next(_write_generations)
+    return wrapper
+
 
 class StorageAdapter:
     """Adapter that bridges VectorStoreBase interface with Memory class expectations."""
@@ -43,8 +62,14 @@ class StorageAdapter:
 
         # Sub stores support (optional, for multi-table routing)
         self.sub_stores: Dict[str, 'SubStoreConfig'] = {}
+        # Union of routing_filter keys across sub stores (see _route_to_store)
+        self._sub_store_routing_keys: Set[str] = set()
         self.migration_manager = None
 
+        # Changes after every write through this adapter; lets callers (e.g.
+        # Memory's search result cache) detect that cached reads are stale.
+        self.write_generation = next(_write_generations)
+
         # Ensure collection exists (will be created with actual vector size when first vector is added)
         # self.vector_store.create_col(self.collection_name, vector_size=1536, distance="cosine")
     
@@ -118,6 +143,7 @@ class StorageAdapter:
                 actual = metadata.get(key)
         return actual == expected
 
+    @_records_write
     def add_memory(self, memory_data: Dict[str, Any]) -> int:
         """Add a memory to the store."""
         # ID will be generated using Snowflake algorithm before insertion
@@ -204,16 +230,70 @@ class StorageAdapter:
     ) -> List[Dict[str, Any]]:
         """Search for memories."""
         # Use the provided query embedding or generate one
-        if query_embedding:
-            query_vector = query_embedding
-        else:
+        if not query_embedding:
             # If no query embedding provided, we can't search meaningfully
             logger.warning("No query embedding provided for search")
             return []
-        
-        # Generate sparse embedding if sparse embedder service is available and query is provided
-        sparse_embedding = self._generate_sparse_embedding(query, "search") if query else None
 
+        target_store, db_filters, search_params = self._prepare_search(user_id, agent_id, run_id, filters)
+        results = self._search_store(
+            target_store, search_params, query_embedding, query, db_filters, limit, threshold
+        )
+        return self._to_search_results(results)
+
+    def search_memories_batch(
+        self,
+        query_embeddings: List[List[float]],
+        queries: Optional[List[Optional[str]]] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 30,
+        threshold: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for memories with several query vectors that share the same filters.
+
+        Filter translation, store routing and search-signature inspection are
+        done once for the whole batch. When ``executor`` is given the
+        individual searches run on it; otherwise they run sequentially.
+
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        if queries is None:
+            queries = [None] * len(query_embeddings)
+        if len(queries) != len(query_embeddings):
+            raise ValueError("queries and query_embeddings must have the same length")
+        if not query_embeddings:
+            return []
+
+        target_store, db_filters, search_params = self._prepare_search(user_id, agent_id, run_id, filters)
+
+        def _search_one(args) -> List[Dict[str, Any]]:
+            query_embedding, query = args
+            if not query_embedding:
+                logger.warning("No query embedding provided for search")
+                return []
+            results = self._search_store(
+                target_store, search_params, query_embedding, query, db_filters, limit, threshold
+            )
+            return self._to_search_results(results)
+
+        jobs = list(zip(query_embeddings, queries))
+        if executor is not None and len(jobs) > 1:
+            return list(executor.map(_search_one, jobs))
+        return [_search_one(job) for job in jobs]
+
+    def _prepare_search(
+        self,
+        user_id: Optional[str],
+        agent_id: Optional[str],
+        run_id: Optional[str],
+        filters: Optional[Dict[str, Any]],
+    ):
+        """Resolve the target store, backend filters and supported search parameters."""
         # Merge user_id/agent_id/run_id into logical filters for sub-store routing,
         # then translate metadata filters into backend-specific payload paths for search.
         effective_filters = filters.copy() if filters else {}
@@ -224,20 +304,35 @@ class StorageAdapter:
         if run_id is not None:
             effective_filters["run_id"] = run_id
         db_filters = self._build_db_filters(user_id, agent_id, run_id, filters)
-        
+
         # Route to target store (main or sub store)
         target_store = self._route_to_store(effective_filters)
 
+        # Check if target_store.search supports sparse_embedding and threshold parameters
+        try:
+            search_params = inspect.signature(target_store.search).parameters
+        except (TypeError, ValueError):
+            search_params = {}
+        return target_store, db_filters, search_params
+
+    def _search_store(
+        self,
+        target_store: VectorStoreBase,
+        search_params,
+        query_vector: List[float],
+        query: Optional[str],
+        db_filters: Optional[Dict[str, Any]],
+        limit: int,
+        threshold: Optional[float],
+    ) -> List[Any]:
+        """Run a single vector search against ``target_store``."""
+        # Generate sparse embedding if sparse embedder service is available and query is provided
+        sparse_embedding = self._generate_sparse_embedding(query, "search") if query else None
+
         # Unified search method - try OceanBase format first, fallback to SQLite
         # Pass query text to enable hybrid search (vector + full-text search)
+        search_query = query if query else ""
         try:
-            # Try OceanBase format first - pass query text for hybrid search
-            search_query = query if query else ""
-            # Check if target_store.search supports sparse_embedding and threshold parameters
-            import inspect
-            search_sig = inspect.signature(target_store.search)
-            search_params = search_sig.parameters
-
             # Build search kwargs based on supported parameters
             search_kwargs = {
                 "query": search_query,
@@ -250,18 +345,19 @@ class StorageAdapter:
             if 'threshold' in search_params:
                 search_kwargs["threshold"] = threshold
 
-            results = target_store.search(**search_kwargs)
+            return target_store.search(**search_kwargs)
         except TypeError:
             # Fallback to SQLite format (doesn't support query text parameter)
             # Pass filters to ensure filtering works correctly
-            results = target_store.search(
-                search_query if query else "",
+            return target_store.search(
+                search_query,
                 vectors=[query_vector],
                 limit=limit,
                 filters=db_filters if db_filters else None,
             )
-        
-        # Convert results to unified format
+
+    def _to_search_results(self, results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert raw vector-store search results to the unified memory format."""
         memories = []
         for result in results:
             # Handle different result formats
@@ -346,35 +442,22 @@ class StorageAdapter:
         # Vector store already applied limit, no need to slice again
         return memories
     
-    def get_memory(
+    def _get_record(
         self,
         memory_id: int,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """Get a specific memory by ID."""
+    ) -> Optional[Any]:
+        """Fetch the raw store record for a memory the caller may access, or None."""
         result = self.vector_store.get(memory_id)
         
         if result and result.payload:
-            content = result.payload.get("data") or result.payload.get("content") or ""
-            memory = {
-                "id": result.id,
-                "content": content,
-                "user_id": result.payload.get("user_id"),
-                "agent_id": result.payload.get("agent_id"),
-                "run_id": result.payload.get("run_id"),
-                "metadata": result.payload.get("metadata", {}),
-                "created_at": result.payload.get("created_at"),
-                "updated_at": result.payload.get("updated_at"),
-            }
-            
             # Check access control
-            if user_id and memory.get("user_id") != user_id:
+            if user_id and result.payload.get("user_id") != user_id:
                 return None
-            if agent_id and memory.get("agent_id") != agent_id:
+            if agent_id and result.payload.get("agent_id") != agent_id:
                 return None
-            
-            return memory
+            return result
         
         # If not found in main store and sub stores exist, search sub stores
         if self.sub_stores:
@@ -382,31 +465,75 @@ class StorageAdapter:
                 try:
                     result = sub_config.vector_store.get(memory_id)
                     if result and result.payload:
-                        content = result.payload.get("data") or result.payload.get("content") or ""
-                        memory = {
-                            "id": result.id,
-                             "content": content,
-                            "user_id": result.payload.get("user_id"),
-                            "agent_id": result.payload.get("agent_id"),
-                            "run_id": result.payload.get("run_id"),
-                            "metadata": result.payload.get("metadata", {}),
-                            "created_at": result.payload.get("created_at"),
-                            "updated_at": result.payload.get("updated_at"),
-                        }
-
                         # Check access control
-                        if user_id and memory.get("user_id") != user_id:
+                        if user_id and result.payload.get("user_id") != user_id:
                             continue
-                        if agent_id and memory.get("agent_id") != agent_id:
+                        if agent_id and result.payload.get("agent_id") != agent_id:
                             continue
-
-                        return memory
+                        return result
                 except Exception as e:
                     logger.debug(f"Error searching in sub store {sub_config.name}: {e}")
                     continue
 
         return None
+
+    def get_memory(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a specific memory by ID."""
+        result = self._get_record(memory_id, user_id, agent_id)
+        if result is None:
+            return None
+
+        content = result.payload.get("data") or result.payload.get("content") or ""
+        return {
+            "id": result.id,
+            "content": content,
+            "user_id": result.payload.get("user_id"),
+            "agent_id": result.payload.get("agent_id"),
+            "run_id": result.payload.get("run_id"),
+            "metadata": result.payload.get("metadata", {}),
+            "created_at": result.payload.get("created_at"),
+            "updated_at": result.payload.get("updated_at"),
+        }
+
+    def get_memory_hash(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get the stored content hash of a memory, or None if it is missing or inaccessible."""
+        hash_and_owner = self.get_memory_hash_and_owner(memory_id, user_id, agent_id)
+        return hash_and_owner[0] if hash_and_owner else None
+
+    def get_memory_hash_and_owner(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """
+        Get the stored content hash of a memory with the user and agent IDs that own it.
+
+        Returns:
+            ``(hash, user_id, agent_id)``, or None if the memory is missing or inaccessible
+        """
+        result = self._get_record(memory_id, user_id, agent_id)
+        if result is None:
+            return None
+        payload = result.payload
+        return payload.get("hash") or None, payload.get("user_id"), payload.get("agent_id")
+
+    @_records_write
+    def update_payload(self, memory_id: int, payload: Dict[str, Any]) -> None:
+        """Update stored payload fields of a memory directly, without re-embedding."""
+        self.vector_store.update(vector_id=memory_id, payload=payload)
     
+    @_records_write
     def update_memory(
         self,
         memory_id: int,
@@ -501,7 +628,30 @@ class StorageAdapter:
         target_store.update(memory_id, vector=update_data.get("embedding"), payload=updated_payload)
         
         return updated_payload
+
+    @_records_write
+    def update_memories(
+        self,
+        updates: List[Tuple[int, Dict[str, Any]]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Apply several ``(memory_id, update_data)`` updates in one call.
+
+        Each update is applied independently: a failure is logged and yields
+        ``None`` for that item without aborting the rest.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for memory_id, update_data in updates:
+            try:
+                results.append(self.update_memory(memory_id, update_data, user_id, agent_id))
+            except Exception as e:
+                logger.warning(f"Failed to update memory {memory_id}: {e}")
+                results.append(None)
+        return results
     
+    @_records_write
     def delete_memory(
         self,
         memory_id: int,
@@ -656,6 +806,7 @@ class StorageAdapter:
             logger.error(f"Failed to count memories with filters {db_filters}: {e}", exc_info=True)
             return 0
     
+    @_records_write
     def clear_memories(
         self,
         user_id: Optional[str] = None,
@@ -771,6 +922,26 @@ class StorageAdapter:
         import asyncio
         return await asyncio.to_thread(self.delete_memory, memory_id, user_id, agent_id)
     
+    async def get_memory_hash_async(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get the stored content hash of a memory asynchronously."""
+        import asyncio
+        return await asyncio.to_thread(self.get_memory_hash, memory_id, user_id, agent_id)
+
+    async def get_memory_hash_and_owner_async(
+        self,
+        memory_id: int,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """Get the stored content hash and owning user/agent IDs of a memory asynchronously."""
+        import asyncio
+        return await asyncio.to_thread(self.get_memory_hash_and_owner, memory_id, user_id, agent_id)
+    
     async def update_memory_async(
         self,
         memory_id: int,
@@ -782,6 +953,16 @@ class StorageAdapter:
         import asyncio
         return await asyncio.to_thread(self.update_memory, memory_id, update_data, user_id, agent_id)
 
+    async def update_memories_async(
+        self,
+        updates: List[Tuple[int, Dict[str, Any]]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Apply several memory updates in one call asynchronously."""
+        import asyncio
+        return await asyncio.to_thread(self.update_memories, updates, user_id, agent_id)
+
     # ==================== Routing Support Methods ====================
 
     def _route_to_store(self, filters_or_metadata: Optional[Dict] = None) -> VectorStoreBase:
@@ -798,21 +979,18 @@ class StorageAdapter:
         if not self.sub_stores:
             return self.vector_store
 
-        # Try to find matching sub store
-        if filters_or_metadata:
+        # Try to find matching sub store (none can match without a routing key)
+        if filters_or_metadata and not self._sub_store_routing_keys.isdisjoint(filters_or_metadata):
             for sub_config in self.sub_stores.values():
-                # Check if sub store is ready (only for query operations)
+                # Match routing rules first (an in-memory items-view subset
+                # test), then the readiness check, which queries the status table
+                if not sub_config.routing_filter.items() <= filters_or_metadata.items():
+                    continue
                 if self.migration_manager and not self.migration_manager.is_ready(sub_config.name):
                     continue
 
-                # Check if filters_or_metadata matches routing rules
-                routing_filter = sub_config.routing_filter
-                if all(
-                    key in filters_or_metadata and filters_or_metadata[key] == value
-                    for key, value in routing_filter.items()
-                ):
-                    logger.debug(f"Routing to sub store: {sub_config.name}")
-                    return sub_config.vector_store
+                logger.debug(f"Routing to sub store: {sub_config.name}")
+                return sub_config.vector_store
 
         # Default to main store
         logger.debug("Routing to main store")
@@ -850,6 +1028,9 @@ class StorageAdapter:
 
 class SubStoreConfig:
     """Configuration for a sub store."""
+    # Read on every routed call; slots keep instances small and attribute reads fast
+    __slots__ = ("name", "routing_filter", "vector_store", "embedding_service")
+
     def __init__(self, name: str, routing_filter: Dict, vector_store: VectorStoreBase, embedding_service=None):
         self.name = name
         self.routing_filter = routing_filter
@@ -909,6 +1090,7 @@ class SubStorageAdapter(StorageAdapter):
             embedding_service=embedding_service
         )
         self.sub_stores[store_name] = sub_config
+        self._sub_store_routing_keys.update(routing_filter)
 
         # Register in migration manager
         if self.migration_manager:
@@ -919,6 +1101,7 @@ class SubStorageAdapter(StorageAdapter):
 
         logger.info(f"Registered sub store: {store_name} with filter: {routing_filter}")
 
+    @_records_write
     def migrate_to_sub_store(
         self,
         store_name: str,
@@ -971,19 +1154,27 @@ class SubStorageAdapter(StorageAdapter):
                     for key, value in routing_filter.items()
                 ])
 
-                # Query only IDs first for efficiency
-                id_query_sql = f"""
-                SELECT id
-                FROM {self.collection_name}
-                WHERE {filter_conditions}
-                LIMIT {batch_size}
-                """
-
+                # Page through matching IDs in primary-key order (keyset
+                # pagination), so each batch is read and written sequentially
+                # and rows kept in the source are never selected twice.
+                last_id = None
                 while True:
-                    id_results = self.vector_store.execute_sql(id_query_sql)
+                    id_conditions = filter_conditions
+                    if last_id is not None:
+                        id_conditions += f" AND id > {int(last_id)}"
+                    id_results = self.vector_store.execute_sql(f"""
+                    SELECT id
+                    FROM {self.collection_name}
+                    WHERE {id_conditions}
+                    ORDER BY id
+                    LIMIT {batch_size}
+                    """)
                     if not id_results:
                         break
+                    last_id = id_results[-1]['id']
 
+                    record_ids: List[int] = []
+                    payloads: List[Dict[str, Any]] = []
                     for id_record in id_results:
                         record_id = id_record['id']
 
@@ -998,37 +1189,29 @@ class SubStorageAdapter(StorageAdapter):
                         payload['id'] = record_id
 
                         # Extract content for re-embedding
-                        content = payload.get('data', '')
-                        if not content:
+                        if not payload.get('data', ''):
                             logger.warning(f"Record {record_id} has no content, skipping")
                             continue
 
-                        # Re-generate vector using sub store's embedding service
-                        try:
-                            vector = sub_embedding_service.embed(content, memory_action="add")
-                            logger.debug(f"Re-embedded record {record_id} with dimension {len(vector)}")
-                        except Exception as embed_error:
-                            logger.error(f"Failed to re-embed record {record_id}: {embed_error}")
-                            continue
+                        record_ids.append(record_id)
+                        payloads.append(payload)
 
-                        try:
-                            target_store.insert([vector], [payload])
-                            migrated_count += 1
+                    migrated_ids = self._migrate_batch(
+                        target_store, sub_embedding_service, record_ids, payloads
+                    )
+                    migrated_count += len(migrated_ids)
 
-                            # Delete from source if requested
-                            if delete_source:
+                    # Delete from source if requested
+                    if delete_source:
+                        for record_id in migrated_ids:
+                            try:
                                 self.vector_store.delete(record_id)
+                            except Exception as e:
+                                logger.error(f"Error deleting migrated record {record_id}: {e}")
 
-                            # Update progress
-                            if self.migration_manager and migrated_count % 10 == 0:
-                                self.migration_manager.update_progress(
-                                    store_name,
-                                    migrated_count,
-                                    migrated_count  # Total is unknown in this approach
-                                )
-                        except Exception as e:
-                            logger.error(f"Error migrating record {record_id}: {e}")
-                            continue
+                    # Update progress
+                    if self.migration_manager and migrated_ids:
+                        self.migration_manager.update_progress(store_name, migrated_count)
 
                     # If we got fewer results than batch_size, we're done
                     if len(id_results) < batch_size:
@@ -1050,6 +1233,53 @@ class SubStorageAdapter(StorageAdapter):
             logger.error(f"Migration failed: {e}")
             raise
 
+    @staticmethod
+    def _migrate_batch(
+        target_store: VectorStoreBase,
+        embedding_service: Any,
+        record_ids: List[int],
+        payloads: List[Dict[str, Any]],
+    ) -> List[int]:
+        """
+        Re-embed and insert one batch of records into a sub store.
+
+        The batch is embedded with one ``embed_batch`` call and written with one
+        multi-row insert. If either step fails, records are retried one by one
+        so a single bad record only skips itself.
+
+        Returns:
+            IDs of the records that were written to the target store
+        """
+        if not record_ids:
+            return []
+
+        try:
+            vectors = embedding_service.embed_batch(
+                [payload['data'] for payload in payloads], memory_action="add"
+            )
+            target_store.insert(vectors, payloads)
+            logger.debug(f"Migrated batch of {len(record_ids)} records")
+            return list(record_ids)
+        except Exception as batch_error:
+            logger.warning(f"Batch migration failed, retrying records individually: {batch_error}")
+
+        migrated_ids = []
+        for record_id, payload in zip(record_ids, payloads):
+            # Re-generate vector using sub store's embedding service
+            try:
+                vector = embedding_service.embed(payload['data'], memory_action="add")
+                logger.debug(f"Re-embedded record {record_id} with dimension {len(vector)}")
+            except Exception as embed_error:
+                logger.error(f"Failed to re-embed record {record_id}: {embed_error}")
+                continue
+
+            try:
+                target_store.insert([vector], [payload])
+                migrated_ids.append(record_id)
+            except Exception as e:
+                logger.error(f"Error migrating record {record_id}: {e}")
+        return migrated_ids
+
     def get_migration_status(self, store_name: str) -> Optional[Dict[str, Any]]:
         """
         Get migration status for a sub store.
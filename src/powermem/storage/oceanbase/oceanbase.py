@@ -504,10 +504,14 @@ class OceanBaseVectorStore(VectorStoreBase):
             # Generate Snowflake IDs for each vector
             generated_ids = [generate_snowflake_id() for _ in range(len(vectors))]
 
+            # Normalize the whole batch at once rather than row by row
+            if self.normalize:
+                vectors = OceanBaseUtil.normalize_batch(vectors)
+
             # Prepare data for insertion with explicit IDs
             data: List[Dict[str, Any]] = []
             for vector, payload, vector_id in zip(vectors, payloads, generated_ids):
-                record = self._build_record_for_insert(vector, payload)
+                record = self._build_record_for_insert(vector, payload, normalized=self.normalize)
                 # Explicitly set the primary key field with Snowflake ID
                 record[self.primary_field] = vector_id
                 data.append(record)
@@ -837,10 +841,11 @@ class OceanBaseVectorStore(VectorStoreBase):
             }
         )
 
-    def _build_record_for_insert(self, vector: List[float], payload: Dict) -> Dict[str, Any]:
+    def _build_record_for_insert(self, vector: List[float], payload: Dict, normalized: bool = False) -> Dict[str, Any]:
         """
         Build a record dictionary for insertion with all standard fields.
         Note: Primary key (id) should be set explicitly before insertion.
+        Pass ``normalized=True`` when the vector was already L2-normalized.
         """
         # Serialize metadata to handle datetime objects
         metadata = payload.get("metadata", {})
@@ -849,7 +854,7 @@ class OceanBaseVectorStore(VectorStoreBase):
         record = {
             # Primary key (id) will be set explicitly in insert() method with Snowflake ID
             self.vector_field: (
-                vector if not self.normalize else OceanBaseUtil.normalize(vector)
+                OceanBaseUtil.normalize(vector) if self.normalize and not normalized else vector
             ),
             self.text_field: payload.get("data") or payload.get("content") or "",
             self.metadata_field: serialized_metadata,
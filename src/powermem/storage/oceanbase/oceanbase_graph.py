@@ -856,29 +856,17 @@ class MemoryGraph(GraphStoreBase):
             for entity in OceanBaseUtil.safe_fetchall(entities_results)
         }
 
-        # Build final results with updated_at for sorting
-        final_results = []
-        for rel in relationships:
-            rel_id, source_id, relationship_type, dest_id, updated_at = rel
-
-            source_name = entity_map.get(source_id, f"Unknown_{source_id}")
-            dest_name = entity_map.get(dest_id, f"Unknown_{dest_id}")
-
-            final_results.append(
-                {
-                    "source": source_name,
-                    "relationship": relationship_type,
-                    "target": dest_name,
-                    "_updated_at": updated_at,  # Keep for sorting
-                }
-            )
-
-        # Sort by updated_at (descending)
-        final_results.sort(key=lambda x: x["_updated_at"], reverse=True)
-
-        # Remove the temporary _updated_at field
-        for result in final_results:
-            del result["_updated_at"]
+        # Sort the raw rows by updated_at (descending) and build the response
+        # dicts in a single pass, without a temporary sort key to strip later.
+        relationships = sorted(relationships, key=lambda rel: rel[4], reverse=True)
+        final_results = [
+            {
+                "source": entity_map.get(source_id, f"Unknown_{source_id}"),
+                "relationship": relationship_type,
+                "target": entity_map.get(dest_id, f"Unknown_{dest_id}"),
+            }
+            for _, source_id, relationship_type, dest_id, _ in relationships
+        ]
 
         logger.info("Retrieved %d relationships", len(final_results))
         return final_results
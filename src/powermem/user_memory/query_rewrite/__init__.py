@@ -1,6 +1,6 @@
 """Query rewrite module"""
 
-from src.powermem.user_memory.query_rewrite.rewriter import QueryRewriter, QueryRewriteResult
+from .rewriter import QueryRewriter, QueryRewriteResult
 
 __all__ = [
     'QueryRewriter',
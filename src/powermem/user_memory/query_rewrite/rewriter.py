@@ -5,7 +5,7 @@ import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 
-from src.powermem.prompts import build_query_rewrite_prompt
+from ...prompts import build_query_rewrite_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -6,6 +6,7 @@ This module provides utility functions and helper classes.
 
 from .utils import (
     generate_memory_id,
+    generate_content_hash,
     validate_memory_data,
     sanitize_content,
     format_memory_for_display,
@@ -22,6 +23,7 @@ from .oceanbase_util import OceanBaseUtil
 
 __all__ = [
     "generate_memory_id",
+    "generate_content_hash",
     "validate_memory_data",
     "sanitize_content",
     "format_memory_for_display",
@@ -419,6 +419,24 @@ class OceanBaseUtil:
         arr = arr / norm
         return arr.tolist()
 
+    @staticmethod
+    def normalize_batch(vectors: List[List[float]]) -> List[List[float]]:
+        """L2-normalize a batch of equal-length vectors in one NumPy pass.
+
+        Zero vectors are returned unchanged, matching ``normalize``.
+        """
+        import numpy as np
+        try:
+            arr = np.asarray(vectors, dtype=np.float64)
+        except ValueError:
+            arr = None
+        if arr is None or arr.ndim != 2:
+            # Ragged input cannot be stacked; fall back to one vector at a time
+            return [OceanBaseUtil.normalize(vector) for vector in vectors]
+        norms = np.linalg.norm(arr, axis=1, keepdims=True)
+        np.divide(arr, norms, out=arr, where=norms != 0)
+        return arr.tolist()
+
     @staticmethod
     def get_fts_parser_enum(parser_name: str):
         """Convert parser name string to FtsParser enum.
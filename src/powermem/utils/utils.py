@@ -30,6 +30,15 @@ except ImportError:
     except ImportError:
         _HAS_PYTZ = False
 
+# orjson is optional: it produces the same canonical bytes as the json fallback
+# below, only faster.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Cache for timezone to avoid repeated lookups
 _timezone_cache: Optional[Any] = None
 _timezone_str: Optional[str] = None  # Store timezone string from config
@@ -260,6 +269,41 @@ def generate_memory_id(content: str, user_id: Optional[str] = None) -> str:
     return hashlib.md5(data.encode()).hexdigest()
 
 
+def generate_content_hash(
+    content: str,
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+) -> str:
+    """
+    Generate the deduplication hash stored alongside a memory.
+
+    The hash covers the content together with its owner so identical text
+    stored for different users or agents is not treated as a duplicate.
+    The key is serialized as canonical JSON (sorted keys, compact separators)
+    so the digest is identical whether or not ``orjson`` is installed.
+
+    Args:
+        content: Memory content
+        user_id: User ID owning the memory
+        agent_id: Agent ID owning the memory
+
+    Returns:
+        32-character hex digest (fits the ``hash`` column). BLAKE2b with a
+        16-byte digest is used: it is faster than MD5 and ships with hashlib,
+        so every installation produces the same value. Rows stored earlier
+        keep an MD5 of the content alone, so dedup recomputes the hash from
+        content and owner instead of comparing stored hashes.
+    """
+    key = {"a": agent_id, "c": content, "u": user_id}
+    if _HAS_ORJSON:
+        key_bytes = orjson.dumps(key, option=orjson.OPT_SORT_KEYS)
+    else:
+        key_bytes = json.dumps(
+            key, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
+
 def validate_memory_data(data: Dict[str, Any]) -> bool:
     """
     Validate memory data structure.
@@ -507,6 +551,36 @@ def extract_json(text):
     return json_str
 
 
+def loads_json(text: str) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Input that orjson rejects but the stdlib accepts (NaN/Infinity, integers
+    beyond 64 bits) is re-parsed with ``json.loads``, so the result always
+    matches ``json.loads``. Raises ``json.JSONDecodeError`` on invalid JSON.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def loads_tool_arguments(arguments: str) -> Any:
+    """
+    Parse the JSON arguments of an LLM tool call.
+
+    Arguments are raw JSON per the chat-completions contract, so they are
+    parsed directly; ``extract_json`` only strips a markdown code fence when
+    that fails. Raises ``json.JSONDecodeError`` on invalid JSON.
+    """
+    try:
+        return loads_json(arguments)
+    except json.JSONDecodeError:
+        return loads_json(extract_json(arguments))
+
+
 def parse_json_from_text(text: str, expected_type: type = dict) -> Optional[Any]:
     """
     Parse JSON from text, with fallback to extract JSON if wrapped in text.
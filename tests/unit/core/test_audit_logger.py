@@ -0,0 +1,67 @@
+"""Tests for AuditLogger background writes."""
+
+import json
+import logging
+
+import pytest
+
+from powermem.core import audit as audit_module
+from powermem.core.audit import AuditLogger
+
+
+@pytest.fixture
+def fresh_audit_logger():
+    audit_logger = logging.getLogger("audit")
+    saved_handlers = audit_logger.handlers[:]
+    audit_logger.handlers.clear()
+    yield audit_logger
+    audit_module._stop_audit_listener()
+    for handler in audit_logger.handlers:
+        handler.close()
+    audit_logger.handlers[:] = saved_handlers
+
+
+def _read_entries(path):
+    return [json.loads(line.split(" - ", 3)[3]) for line in path.read_text().splitlines()]
+
+
+def test_log_event_is_written_by_background_listener(tmp_path, fresh_audit_logger):
+    log_file = tmp_path / "audit.log"
+    audit = AuditLogger({"log_file": str(log_file), "compress_logs": False})
+
+    audit.log_event("memory.add", {"memory_id": 1}, user_id="u1")
+    audit_module._stop_audit_listener()  # drains the queue
+
+    entries = _read_entries(log_file)
+    assert [e["event_type"] for e in entries] == ["memory.add"]
+    assert entries[0]["user_id"] == "u1"
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path, fresh_audit_logger):
+    AuditLogger({"log_file": str(tmp_path / "audit.log"), "compress_logs": False, "queue_size": 1})
+    audit_module._stop_audit_listener()  # nothing drains the queue any more
+
+    queue_handler = fresh_audit_logger.handlers[0]
+    fresh_audit_logger.info("first")
+    fresh_audit_logger.info("second")
+    assert queue_handler.dropped == 1
+
+
+def test_sync_mode_writes_immediately(tmp_path, fresh_audit_logger):
+    log_file = tmp_path / "audit.log"
+    audit = AuditLogger({"log_file": str(log_file), "compress_logs": False, "async_logging": False})
+
+    audit.log_event("memory.delete", {"memory_id": 2})
+
+    assert [e["event_type"] for e in _read_entries(log_file)] == ["memory.delete"]
+
+
+def test_get_audit_logs_waits_for_queued_records(tmp_path, fresh_audit_logger):
+    log_file = tmp_path / "audit.log"
+    audit = AuditLogger({"log_file": str(log_file), "compress_logs": False})
+
+    audit.log_event("memory.update", {"memory_id": 3})
+    audit.get_audit_logs()
+
+    # Written by the listener before get_audit_logs read the file
+    assert [e["event_type"] for e in _read_entries(log_file)] == ["memory.update"]
@@ -0,0 +1,112 @@
+"""Tests for TelemetryManager background sending."""
+
+import json
+import threading
+from unittest.mock import patch
+
+from powermem.core.telemetry import TelemetryManager
+
+
+def test_disabled_manager_starts_no_worker():
+    telemetry = TelemetryManager({"enabled": False})
+
+    telemetry.capture_event("memory.add")
+
+    assert telemetry._worker is None
+    assert telemetry._queue.empty()
+
+
+def test_capture_event_is_sent_by_background_worker():
+    sent = []
+    done = threading.Event()
+
+    def fake_send(payload, headers):
+        sent.append((threading.current_thread().name, [e["event_name"] for e in payload["events"]]))
+        done.set()
+
+    with patch.object(TelemetryManager, "_send_events_async", side_effect=fake_send):
+        telemetry = TelemetryManager({"enabled": True, "batch_size": 2, "flush_interval": 5})
+        telemetry.capture_event("memory.add")
+        telemetry.capture_event("memory.search")
+        assert done.wait(timeout=5)
+
+    assert sent == [("powermem-telemetry", ["memory.add", "memory.search"])]
+
+
+def test_flush_drains_queue_on_caller_thread_and_full_queue_drops():
+    with patch.object(TelemetryManager, "_send_events_async") as mock_send, \
+         patch.object(threading.Thread, "start"):
+        telemetry = TelemetryManager({"enabled": True, "batch_size": 2, "queue_size": 3})
+        for _ in range(5):
+            telemetry.capture_event("memory.add")
+
+        assert telemetry.dropped == 2
+        telemetry.flush()
+
+    assert mock_send.call_count == 2
+    assert [len(call.args[0]["events"]) for call in mock_send.call_args_list] == [2, 1]
+    assert telemetry._queue.empty()
+
+
+def test_sync_sends_reuse_one_client_until_close():
+    with patch.object(threading.Thread, "start"):
+        telemetry = TelemetryManager({"enabled": True})
+    client = telemetry._client
+    with patch.object(client, "post") as mock_post, patch.object(client, "close") as mock_close:
+        telemetry._send_events_async({"events": []}, {})
+        telemetry._send_events_async({"events": []}, {})
+        telemetry.close()
+
+    assert mock_post.call_count == 2
+    mock_close.assert_called_once()
+    assert telemetry._client is None
+
+
+def test_sync_send_posts_pre_encoded_json_body():
+    with patch.object(threading.Thread, "start"):
+        telemetry = TelemetryManager({"enabled": True})
+    with patch.object(telemetry._client, "post") as mock_post:
+        telemetry._send_events_async({"events": [{"event_name": "memory.add", "n": 2**70}]}, {})
+    telemetry.close()
+
+    body = mock_post.call_args.kwargs["content"]
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"events": [{"event_name": "memory.add", "n": 2**70}]}
+
+
+def test_flush_sends_batch_held_by_worker():
+    with patch.object(TelemetryManager, "_send_events_async") as mock_send:
+        telemetry = TelemetryManager({"enabled": True, "batch_size": 10, "flush_interval": 60})
+        for _ in range(3):
+            telemetry.capture_event("memory.add")
+        telemetry.flush(timeout=5)
+
+        assert mock_send.call_count == 1
+        assert len(mock_send.call_args.args[0]["events"]) == 3
+        telemetry.close(timeout=5)
+
+
+def test_close_stops_worker_before_closing_client():
+    with patch.object(TelemetryManager, "_send_events_async") as mock_send, \
+         patch("atexit.unregister") as mock_unregister:
+        telemetry = TelemetryManager({"enabled": True, "batch_size": 10, "flush_interval": 60})
+        client = telemetry._client
+        telemetry.capture_event("memory.add")
+        with patch.object(client, "close") as mock_close:
+            telemetry.close(timeout=5)
+
+    assert not telemetry._worker.is_alive()
+    assert mock_send.call_count == 1
+    mock_close.assert_called_once()
+    mock_unregister.assert_called_once_with(telemetry.close)
+
+
+def test_closed_manager_ignores_new_events():
+    with patch.object(TelemetryManager, "_send_events_async") as mock_send:
+        telemetry = TelemetryManager({"enabled": True})
+        telemetry.close(timeout=5)
+        telemetry.capture_event("memory.add")
+        telemetry.flush()
+
+    assert telemetry._queue.empty()
+    mock_send.assert_not_called()
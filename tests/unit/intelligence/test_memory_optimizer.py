@@ -1,6 +1,9 @@
+import hashlib
+
 import pytest
 from unittest.mock import MagicMock, call
 from powermem.intelligence.memory_optimizer import MemoryOptimizer
+from powermem.utils.utils import generate_content_hash
 
 @pytest.fixture
 def mock_storage():
@@ -38,6 +41,25 @@ def test_deduplicate_exact_match(optimizer, mock_storage):
     # Let's assume we keep the oldest (id 1) and delete newer ones (id 2).
     mock_storage.delete_memory.assert_called_once_with(2, user_id="user1")
 
+def test_deduplicate_exact_matches_legacy_md5_and_blake2b_hashes(optimizer, mock_storage):
+    # Rows stored before the BLAKE2b switch carry an MD5 of the bare content
+    legacy_hash = hashlib.md5("Hello World".encode("utf-8")).hexdigest()
+    current_hash = generate_content_hash("Hello World", "user1", "agent1")
+    mock_storage.get_all_memories.return_value = [
+        {"id": 1, "memory": "Hello World", "user_id": "user1", "agent_id": "agent1",
+         "hash": legacy_hash, "created_at": "2024-01-01T10:00:00"},
+        {"id": 2, "memory": "Hello World", "user_id": "user1", "agent_id": "agent1",
+         "hash": current_hash, "created_at": "2024-01-02T10:00:00"},
+        # Same text for another agent is not a duplicate
+        {"id": 3, "memory": "Hello World", "user_id": "user1", "agent_id": "agent2",
+         "hash": legacy_hash, "created_at": "2024-01-03T10:00:00"},
+    ]
+
+    stats = optimizer.deduplicate(user_id="user1", strategy="exact")
+
+    assert stats["duplicates_found"] == 1
+    mock_storage.delete_memory.assert_called_once_with(2, user_id="user1")
+
 def test_calculate_similarity():
     # Test identical vectors
     v1 = [1.0, 0.0, 0.0]
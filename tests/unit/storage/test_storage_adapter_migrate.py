@@ -0,0 +1,50 @@
+"""Unit tests for SubStorageAdapter.migrate_to_sub_store."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from powermem.storage.adapter import SubStorageAdapter
+from powermem.storage.oceanbase.oceanbase import OceanBaseVectorStore
+
+
+def _make_adapter(monkeypatch, rows):
+    monkeypatch.setattr("powermem.storage.migration_manager.SubStoreMigrationManager", MagicMock())
+    main_store = MagicMock(spec=OceanBaseVectorStore)
+    main_store.collection_name = "memories"
+
+    def execute_sql(sql):
+        after = int(sql.split("id > ")[1].split()[0]) if "id > " in sql else 0
+        return [{"id": row_id} for row_id in rows if row_id > after][:2]
+
+    main_store.execute_sql.side_effect = execute_sql
+    main_store.get.side_effect = lambda row_id: SimpleNamespace(payload={"data": f"memory {row_id}"})
+
+    sub_store, embedding = MagicMock(), MagicMock()
+    embedding.embed_batch.side_effect = lambda texts, memory_action=None: [[0.1]] * len(texts)
+    adapter = SubStorageAdapter(main_store)
+    adapter.register_sub_store("memories_sub_0", {"category": "code"}, sub_store, embedding)
+    return adapter, main_store, sub_store, embedding
+
+
+def test_migrate_pages_by_id_and_inserts_batches(monkeypatch):
+    adapter, main_store, sub_store, embedding = _make_adapter(monkeypatch, [1, 2, 3])
+
+    assert adapter.migrate_to_sub_store("memories_sub_0", batch_size=2) == 3
+
+    assert [len(call.args[0]) for call in sub_store.insert.call_args_list] == [2, 1]
+    assert embedding.embed_batch.call_count == 2
+    embedding.embed.assert_not_called()
+    main_store.delete.assert_not_called()
+
+
+def test_migrate_falls_back_to_single_records_on_batch_failure(monkeypatch):
+    adapter, main_store, sub_store, embedding = _make_adapter(monkeypatch, [1, 2])
+    embedding.embed_batch.side_effect = RuntimeError("batch rejected")
+    embedding.embed.side_effect = lambda text, memory_action=None: (
+        [0.2] if text == "memory 1" else (_ for _ in ()).throw(ValueError("bad record"))
+    )
+
+    assert adapter.migrate_to_sub_store("memories_sub_0", delete_source=True, batch_size=2) == 1
+
+    sub_store.insert.assert_called_once_with([[0.2]], [{"data": "memory 1", "id": 1}])
+    main_store.delete.assert_called_once_with(1)
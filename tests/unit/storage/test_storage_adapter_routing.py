@@ -0,0 +1,36 @@
+"""Unit tests for StorageAdapter sub-store routing."""
+
+from unittest.mock import MagicMock
+
+from powermem.storage.adapter import SubStorageAdapter
+
+
+def test_route_to_store_skips_scan_without_routing_keys(monkeypatch):
+    monkeypatch.setattr("powermem.storage.migration_manager.SubStoreMigrationManager", MagicMock())
+    main_store, sub_store = MagicMock(), MagicMock()
+    adapter = SubStorageAdapter(main_store)
+    adapter.migration_manager.is_ready.return_value = True
+    adapter.register_sub_store("memories_sub_0", {"category": "code"}, sub_store)
+    adapter.migration_manager.is_ready.reset_mock()
+
+    assert adapter._route_to_store({"user_id": "u1"}) is main_store
+    adapter.migration_manager.is_ready.assert_not_called()
+
+    assert adapter._route_to_store({"user_id": "u1", "category": "code"}) is sub_store
+    assert adapter._route_to_store({"category": "chat"}) is main_store
+
+
+def test_route_to_store_checks_readiness_only_for_matching_stores(monkeypatch):
+    monkeypatch.setattr("powermem.storage.migration_manager.SubStoreMigrationManager", MagicMock())
+    main_store, code_store, chat_store = MagicMock(), MagicMock(), MagicMock()
+    adapter = SubStorageAdapter(main_store)
+    adapter.register_sub_store("memories_sub_0", {"category": "code"}, code_store)
+    adapter.register_sub_store("memories_sub_1", {"category": "chat", "tags": ["a"]}, chat_store)
+    adapter.migration_manager.is_ready.return_value = True
+    adapter.migration_manager.is_ready.reset_mock()
+
+    assert adapter._route_to_store({"category": "chat", "tags": ["a"]}) is chat_store
+    adapter.migration_manager.is_ready.assert_called_once_with("memories_sub_1")
+
+    adapter.migration_manager.is_ready.return_value = False
+    assert adapter._route_to_store({"category": "code"}) is main_store
@@ -0,0 +1,54 @@
+"""Unit tests for StorageAdapter.search_memories / search_memories_batch."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from powermem.storage.adapter import StorageAdapter
+
+
+class _FakeStore:
+    collection_name = "memories"
+
+    def __init__(self):
+        self.calls = []
+
+    def search(self, query, vectors, limit=5, filters=None, threshold=None):
+        self.calls.append({"query": query, "vectors": vectors, "limit": limit, "filters": filters})
+        return [{"id": len(self.calls), "data": f"hit for {query}", "score": 0.5, "user_id": "u1"}]
+
+
+def test_search_memories_converts_results():
+    adapter = StorageAdapter(_FakeStore())
+    results = adapter.search_memories([0.1], user_id="u1", limit=3, query="tea")
+
+    assert len(results) == 1
+    assert results[0]["id"] == 1
+    assert results[0]["memory"] == "hit for tea"
+    assert results[0]["score"] == 0.5
+    assert results[0]["user_id"] == "u1"
+    assert adapter.vector_store.calls[0]["filters"] == {"user_id": "u1"}
+
+
+def test_search_memories_batch_keeps_order_and_shares_filters():
+    store = _FakeStore()
+    adapter = StorageAdapter(store)
+    adapter._build_db_filters = MagicMock(wraps=adapter._build_db_filters)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = adapter.search_memories_batch(
+            query_embeddings=[[0.1], [0.2], [0.3]],
+            queries=["a", "b", "c"],
+            user_id="u1",
+            limit=5,
+            executor=executor,
+        )
+
+    assert [batch[0]["memory"] for batch in batches] == ["hit for a", "hit for b", "hit for c"]
+    assert adapter._build_db_filters.call_count == 1
+    assert len(store.calls) == 3
+
+
+def test_search_memories_batch_skips_missing_embeddings():
+    adapter = StorageAdapter(_FakeStore())
+    assert adapter.search_memories_batch([[0.1], []], ["a", "b"])[1] == []
+    assert adapter.search_memories_batch([]) == []
@@ -0,0 +1,58 @@
+"""Unit tests for StorageAdapter update helpers and stored hash lookups."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from powermem.storage.adapter import StorageAdapter
+
+
+def test_update_memories_applies_each_update_and_isolates_failures():
+    adapter = StorageAdapter(MagicMock())
+
+    def fake_update(memory_id, update_data, user_id=None, agent_id=None):
+        if memory_id == 2:
+            raise RuntimeError("boom")
+        return {"id": memory_id, **update_data}
+
+    adapter.update_memory = MagicMock(side_effect=fake_update)
+    generation = adapter.write_generation
+
+    results = adapter.update_memories(
+        [(1, {"a": 1}), (2, {"b": 2}), (3, {"c": 3})], user_id="u1", agent_id="a1"
+    )
+
+    assert results == [{"id": 1, "a": 1}, None, {"id": 3, "c": 3}]
+    assert adapter.update_memory.call_count == 3
+    adapter.update_memory.assert_any_call(3, {"c": 3}, "u1", "a1")
+    assert adapter.write_generation != generation
+
+
+def test_update_payload_skips_reembedding_and_advances_generation():
+    store = MagicMock()
+    embedding = MagicMock()
+    adapter = StorageAdapter(store, embedding)
+    generation = adapter.write_generation
+
+    adapter.update_payload(1, {"metadata": {"access_count": 2}})
+
+    store.update.assert_called_once_with(vector_id=1, payload={"metadata": {"access_count": 2}})
+    embedding.embed.assert_not_called()
+    assert adapter.write_generation != generation
+
+
+def test_get_memory_hash_respects_access_control():
+    store = MagicMock()
+    store.get.return_value = SimpleNamespace(id=1, payload={"user_id": "u1", "hash": "abc", "data": "x"})
+    adapter = StorageAdapter(store)
+
+    assert adapter.get_memory_hash(1, user_id="u1") == "abc"
+    assert adapter.get_memory_hash(1, user_id="someone-else") is None
+
+
+def test_get_memory_hash_and_owner_returns_stored_owner():
+    store = MagicMock()
+    store.get.return_value = SimpleNamespace(id=1, payload={"user_id": "u1", "agent_id": "a1", "hash": "abc"})
+    adapter = StorageAdapter(store)
+
+    assert adapter.get_memory_hash_and_owner(1) == ("abc", "u1", "a1")
+    assert adapter.get_memory_hash_and_owner(1, agent_id="other") is None
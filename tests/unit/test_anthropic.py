@@ -76,3 +76,21 @@ def test_anthropic_llm_api_key_from_env_takes_precedence(monkeypatch):
 
     assert llm.client.auth_headers == {"X-Api-Key": "env-api-key"}
     assert str(llm.client.base_url) == "https://env-gateway.example.com"
+
+
+@pytest.mark.parametrize("prompt_caching", [False, True])
+def test_anthropic_llm_system_prompt_caching(monkeypatch, prompt_caching):
+    from unittest.mock import MagicMock
+
+    monkeypatch.delenv("ANTHROPIC_AUTH_TOKEN", raising=False)
+    llm = AnthropicLLM(AnthropicConfig(api_key="fake-key", prompt_caching=prompt_caching))
+    llm.client = MagicMock()
+    llm.client.messages.create.return_value.content = [MagicMock(text="ok")]
+
+    llm.generate_response([{"role": "system", "content": "rules"}, {"role": "user", "content": "hi"}])
+
+    system = llm.client.messages.create.call_args.kwargs["system"]
+    if prompt_caching:
+        assert system == [{"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}]
+    else:
+        assert system == "rules"
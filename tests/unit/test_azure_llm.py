@@ -0,0 +1,95 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from powermem.integrations.llm import azure
+from powermem.integrations.llm.azure import AzureLLM
+from powermem.integrations.llm.config.azure import AzureOpenAIConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    azure._build_client.cache_clear()
+    azure._default_token_provider.cache_clear()
+    yield
+    azure._build_client.cache_clear()
+    azure._default_token_provider.cache_clear()
+
+
+def _config(**kwargs):
+    return AzureOpenAIConfig(
+        model="gpt-4o", azure_endpoint="https://example.openai.azure.com", api_version="2025-01-01-preview", **kwargs
+    )
+
+
+def test_clients_are_shared_per_endpoint_and_key():
+    with patch("powermem.integrations.llm.azure.AzureOpenAI", side_effect=lambda **kw: Mock()) as mock_azure:
+        first = AzureLLM(_config(api_key="key-a"))
+        second = AzureLLM(_config(api_key="key-a"))
+        other = AzureLLM(_config(api_key="key-b"))
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert mock_azure.call_count == 2
+
+
+def test_client_cache_is_bounded():
+    with patch("powermem.integrations.llm.azure.AzureOpenAI", side_effect=lambda **kw: Mock()) as mock_azure:
+        first = AzureLLM(_config(api_key="key-0"))
+        for i in range(1, azure._CLIENT_CACHE_SIZE + 1):
+            AzureLLM(_config(api_key=f"key-{i}"))
+        again = AzureLLM(_config(api_key="key-0"))
+
+    assert azure._build_client.cache_info().currsize == azure._CLIENT_CACHE_SIZE
+    assert again.client is not first.client
+    assert mock_azure.call_count == azure._CLIENT_CACHE_SIZE + 2
+
+
+def test_default_credential_is_built_once(monkeypatch):
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+    with patch("powermem.integrations.llm.azure.AzureOpenAI"), \
+            patch("azure.identity.DefaultAzureCredential") as mock_credential, \
+            patch("azure.identity.get_bearer_token_provider") as mock_provider:
+        AzureLLM(_config())
+        AzureLLM(_config())
+
+    mock_credential.assert_called_once()
+    mock_provider.assert_called_once_with(mock_credential.return_value, azure._COGNITIVE_SERVICES_SCOPE)
+
+
+def test_parse_response_decodes_tool_call_arguments():
+    with patch("powermem.integrations.llm.azure.AzureOpenAI"):
+        llm = AzureLLM(_config(api_key="key-a"))
+
+    def tool_call(name, arguments):
+        call = Mock()
+        call.function.name = name
+        call.function.arguments = arguments
+        return call
+
+    message = Mock(content=None)
+    message.tool_calls = [
+        tool_call("add", '{"text": "hello", "ids": [1, 2]}'),
+        tool_call("score", '{"value": NaN}'),
+        tool_call("broken", '{"text": '),
+        tool_call("fenced", '```json\n{"text": "fenced"}\n```'),
+        tool_call("literal_fence", '{"text": "```py\\nx = 1\\n```"}'),
+    ]
+    response = Mock(choices=[Mock(message=message)])
+
+    parsed = llm._parse_response(response, tools=[{"type": "function"}])
+
+    assert parsed["tool_calls"][0] == {"name": "add", "arguments": {"text": "hello", "ids": [1, 2]}}
+    assert parsed["tool_calls"][1]["name"] == "score"
+    assert parsed["tool_calls"][2] == {"name": "fenced", "arguments": {"text": "fenced"}}
+    assert parsed["tool_calls"][3] == {"name": "literal_fence", "arguments": {"text": "```py\nx = 1\n```"}}
+    assert len(parsed["tool_calls"]) == 4
+
+
+def test_parse_response_without_tool_calls():
+    with patch("powermem.integrations.llm.azure.AzureOpenAI"):
+        llm = AzureLLM(_config(api_key="key-a"))
+    response = Mock(choices=[Mock(message=Mock(content="plain answer", tool_calls=None))])
+
+    assert llm._parse_response(response, tools=[{"type": "function"}]) == {"content": "plain answer", "tool_calls": []}
+    assert llm._parse_response(response, tools=None) == "plain answer"
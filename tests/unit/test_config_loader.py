@@ -2,6 +2,7 @@ import os
 
 import powermem.config_loader as config_loader
 import powermem.settings as settings
+from powermem.configs import MemoryConfig
 
 
 def _reset_env(monkeypatch, keys):
@@ -127,6 +128,19 @@ def test_load_config_from_env_loads_internal_settings(monkeypatch):
     assert config["memory_decay"]["enabled"] is False
 
 
+def test_load_config_from_env_audit_writer_settings(monkeypatch):
+    _reset_env(monkeypatch, ["AUDIT_ASYNC_LOGGING", "AUDIT_QUEUE_SIZE"])
+    _disable_env_file(monkeypatch)
+    monkeypatch.setenv("AUDIT_ASYNC_LOGGING", "false")
+    monkeypatch.setenv("AUDIT_QUEUE_SIZE", "5")
+
+    config = config_loader.load_config_from_env()
+
+    audit = MemoryConfig(audit=config["audit"]).audit.model_dump()
+    assert audit["async_logging"] is False
+    assert audit["queue_size"] == 5
+
+
 def test_load_config_from_env_telemetry_aliases(monkeypatch):
     _reset_env(
         monkeypatch,
@@ -134,12 +148,14 @@ def test_load_config_from_env_telemetry_aliases(monkeypatch):
             "TELEMETRY_ENABLED",
             "TELEMETRY_BATCH_SIZE",
             "TELEMETRY_FLUSH_INTERVAL",
+            "TELEMETRY_QUEUE_SIZE",
         ],
     )
     _disable_env_file(monkeypatch)
     monkeypatch.setenv("TELEMETRY_ENABLED", "true")
     monkeypatch.setenv("TELEMETRY_BATCH_SIZE", "42")
     monkeypatch.setenv("TELEMETRY_FLUSH_INTERVAL", "15")
+    monkeypatch.setenv("TELEMETRY_QUEUE_SIZE", "7")
 
     config = config_loader.load_config_from_env()
 
@@ -149,6 +165,8 @@ def test_load_config_from_env_telemetry_aliases(monkeypatch):
     assert telemetry["telemetry_flush_interval"] == 15
     assert telemetry["batch_size"] == 42
     assert telemetry["flush_interval"] == 15
+    assert telemetry["queue_size"] == 7
+    assert MemoryConfig(telemetry=telemetry).telemetry.queue_size == 7
 
 
 def test_load_config_from_env_embedding_provider_values(monkeypatch):
@@ -0,0 +1,32 @@
+"""Tests for generate_content_hash."""
+
+import hashlib
+import json
+
+from powermem.utils import utils
+from powermem.utils.utils import generate_content_hash
+
+
+def test_content_hash_fits_hash_column():
+    digest = generate_content_hash("I like tea", "alice", "agent-1")
+    assert len(digest) == 32
+    assert int(digest, 16) >= 0
+
+
+def test_content_hash_is_scoped_by_owner():
+    base = generate_content_hash("I like tea", "alice", "agent-1")
+    assert base == generate_content_hash("I like tea", "alice", "agent-1")
+    assert base != generate_content_hash("I like tea", "bob", "agent-1")
+    assert base != generate_content_hash("I like tea", "alice", "agent-2")
+    assert base != generate_content_hash("I like coffee", "alice", "agent-1")
+
+
+def test_content_hash_matches_json_fallback(monkeypatch):
+    with_orjson = generate_content_hash("café ☃", "u", None)
+    monkeypatch.setattr(utils, "_HAS_ORJSON", False)
+    assert generate_content_hash("café ☃", "u", None) == with_orjson
+    expected_key = json.dumps(
+        {"a": None, "c": "café ☃", "u": "u"},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    ).encode("utf-8")
+    assert with_orjson == hashlib.blake2b(expected_key, digest_size=16).hexdigest()
@@ -0,0 +1,66 @@
+"""Tests for the in-process embedding cache."""
+
+from unittest.mock import MagicMock
+
+from powermem.integrations.embeddings.cache import CachedEmbedding, CachedSparseEmbedding, EmbeddingCache
+
+
+def _fake_embedder():
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda text, memory_action=None: [float(len(text))]
+    embedder.embed_batch.side_effect = lambda texts, memory_action=None: [[float(len(t))] for t in texts]
+    return embedder
+
+
+def test_repeated_embed_is_served_from_cache():
+    embedder = _fake_embedder()
+    cached = CachedEmbedding(embedder, maxsize=10, ttl=60)
+
+    assert cached.embed("hello", memory_action="add") == [5.0]
+    assert cached.embed("hello", memory_action="update") == [5.0]
+    assert embedder.embed.call_count == 1
+
+    # Query embeddings live in a separate bucket
+    cached.embed("hello", memory_action="search")
+    assert embedder.embed.call_count == 2
+
+
+def test_embed_batch_only_sends_misses():
+    embedder = _fake_embedder()
+    cached = CachedEmbedding(embedder, maxsize=10, ttl=60)
+    cached.embed("a", memory_action="add")
+
+    assert cached.embed_batch(["a", "bb", "ccc"], memory_action="add") == [[1.0], [2.0], [3.0]]
+    embedder.embed_batch.assert_called_once_with(["bb", "ccc"], memory_action="add")
+
+
+def test_cache_evicts_lru_and_expired_entries(monkeypatch):
+    cache = EmbeddingCache(maxsize=2, ttl=10)
+    clock = [100.0]
+    monkeypatch.setattr("powermem.utils.cache.time.monotonic", lambda: clock[0])
+
+    cache.set(b"a", [1.0])
+    cache.set(b"b", [2.0])
+    cache.get(b"a")
+    cache.set(b"c", [3.0])
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == [1.0]
+
+    clock[0] += 11
+    assert cache.get(b"a") is None
+
+
+def test_other_attributes_are_delegated():
+    embedder = _fake_embedder()
+    embedder.config.embedding_dims = 8
+    assert CachedEmbedding(embedder).config.embedding_dims == 8
+
+
+def test_repeated_embed_sparse_is_served_from_cache():
+    embedder = MagicMock()
+    embedder.embed_sparse.side_effect = lambda text, memory_action=None: {len(text): 1.0}
+    cached = CachedSparseEmbedding(embedder, maxsize=10, ttl=60)
+
+    assert cached.embed_sparse("hello", memory_action="add") == {5: 1.0}
+    assert cached.embed_sparse("hello", memory_action="add") == {5: 1.0}
+    assert embedder.embed_sparse.call_count == 1
@@ -39,8 +39,10 @@ def test_memory_search_marks_forgotten_memories_without_deleting():
 
     assert result["results"][0]["id"] == "memory-1"
     storage.delete_memory.assert_not_called()
-    storage.update_memory.assert_called_once()
-    mem_id, updates, user_id, agent_id = storage.update_memory.call_args.args
+    storage.update_memories.assert_called_once()
+    batch, user_id, agent_id = storage.update_memories.call_args.args
+    assert len(batch) == 1
+    mem_id, updates = batch[0]
     assert mem_id == "memory-1"
     assert user_id == "user-1"
     assert agent_id == "agent-1"
@@ -64,7 +66,7 @@ def test_async_memory_search_marks_forgotten_memories_without_deleting():
                     {"id": "memory-1", "memory": "stale memory", "metadata": {}, "score": 0.9}
                 ]
             ),
-            update_memory_async=AsyncMock(),
+            update_memories_async=AsyncMock(),
             delete_memory_async=AsyncMock(),
         )
         memory.storage = storage
@@ -73,8 +75,10 @@ def test_async_memory_search_marks_forgotten_memories_without_deleting():
 
         assert result["results"][0]["id"] == "memory-1"
         storage.delete_memory_async.assert_not_called()
-        storage.update_memory_async.assert_awaited_once()
-        mem_id, updates, user_id, agent_id = storage.update_memory_async.call_args.args
+        storage.update_memories_async.assert_awaited_once()
+        batch, user_id, agent_id = storage.update_memories_async.call_args.args
+        assert len(batch) == 1
+        mem_id, updates = batch[0]
         assert mem_id == "memory-1"
         assert user_id == "user-1"
         assert agent_id == "agent-1"
@@ -0,0 +1,48 @@
+"""Tests for the in-process LLM response cache."""
+
+from unittest.mock import MagicMock
+
+from powermem.integrations.llm.cache import CachedLLM
+
+
+def _fake_llm():
+    llm = MagicMock()
+    llm.config.model = "test-model"
+    llm.generate_response.side_effect = lambda messages, **kwargs: {
+        "content": messages[-1]["content"],
+        "tool_calls": [],
+    }
+    return llm
+
+
+def test_identical_requests_are_served_from_cache():
+    llm = _fake_llm()
+    cached = CachedLLM(llm, maxsize=10, ttl=60)
+    messages = [{"role": "user", "content": "hello"}]
+
+    first = cached.generate_response(messages, response_format={"type": "json_object"})
+    first["tool_calls"].append("mutated by caller")
+    second = cached.generate_response(messages, response_format={"type": "json_object"})
+
+    assert second == {"content": "hello", "tool_calls": []}
+    assert llm.generate_response.call_count == 1
+
+
+def test_requests_differing_in_any_part_are_not_shared():
+    llm = _fake_llm()
+    cached = CachedLLM(llm, maxsize=10, ttl=60)
+    messages = [{"role": "user", "content": "hello"}]
+
+    cached.generate_response(messages)
+    cached.generate_response([{"role": "user", "content": "bye"}])
+    cached.generate_response(messages, response_format={"type": "json_object"})
+    cached.generate_response(messages, tools=[{"type": "function", "function": {"name": "f"}}])
+
+    assert llm.generate_response.call_count == 4
+
+
+def test_other_attributes_are_delegated():
+    llm = _fake_llm()
+    llm.is_noop = False
+    assert CachedLLM(llm).is_noop is False
+    assert CachedLLM(llm).config.model == "test-model"
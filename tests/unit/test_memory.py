@@ -8,6 +8,8 @@ import pytest
 from unittest.mock import MagicMock, patch, Mock
 from powermem import Memory
 from powermem.core.base import MemoryBase
+from powermem.core.memory import _split_category
+from powermem.integrations.llm.cache import CachedLLM
 
 
 class TestMemory:
@@ -48,6 +50,7 @@ class TestMemory:
         
         mock_embedder = MagicMock()
         mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3] for _ in texts]
         mock_embedder_factory.create.return_value = mock_embedder
         
         memory = Memory()
@@ -58,6 +61,134 @@ class TestMemory:
         
         assert "results" in result or isinstance(result, dict)
     
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_simple_add_writes_graph_in_background(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """The graph store write runs on the graph executor and its relations are returned."""
+        import threading
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.insert.return_value = ["test_id_1"]
+        mock_vector_factory.create.return_value = mock_vector_store
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        memory.enable_graph = True
+        graph_threads = []
+
+        def fake_add_to_graph(messages, filters, user_id, agent_id, run_id):
+            graph_threads.append(threading.current_thread().name)
+            return {"added_entities": [{"source": "alice"}], "deleted_entities": []}
+
+        with patch.object(memory, '_is_embedded_store', return_value=False), \
+             patch.object(memory, '_add_to_graph', side_effect=fake_add_to_graph):
+            result = memory.add("Alice likes tea", user_id="test_user", infer=False)
+
+        assert result["relations"]["added_entities"] == [{"source": "alice"}]
+        assert len(graph_threads) == 1
+        assert graph_threads[0].startswith("powermem-graph")
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_intelligent_add_without_actions_writes_graph_once(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """With no LLM actions, only the simple-add fallback writes the graph; without it nothing does."""
+        mock_vector_store = MagicMock()
+        mock_vector_store.search.return_value = []
+        mock_vector_factory.create.return_value = mock_vector_store
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3] for _ in texts]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        memory.enable_graph = True
+
+        for fallback, expected_graph_writes in ((True, 1), (False, 0)):
+            memory._fallback_to_simple_add = fallback
+            with patch.object(memory, '_is_embedded_store', return_value=False), \
+                    patch.object(memory, '_extract_facts', return_value=["likes tea"]), \
+                    patch.object(memory, '_decide_memory_actions', return_value=[]), \
+                    patch.object(memory, '_add_to_graph', return_value=None) as mock_graph:
+                memory.add("I like tea", user_id="test_user")
+
+            assert mock_graph.call_count == expected_graph_writes
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_simple_add_skips_graph_when_storage_fails(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """The graph is only written once the memory is stored."""
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        memory.enable_graph = True
+
+        with patch.object(memory.storage, 'add_memory', side_effect=RuntimeError("store down")), \
+                patch.object(memory, '_add_to_graph') as mock_graph, \
+                pytest.raises(RuntimeError):
+            memory.add("Alice likes tea", user_id="test_user", infer=False)
+
+        mock_graph.assert_not_called()
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_intelligent_add_embeds_duplicate_facts_once(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Duplicate extracted facts are embedded and searched only once."""
+        mock_vector_store = MagicMock()
+        mock_vector_store.search.return_value = []
+        mock_vector_factory.create.return_value = mock_vector_store
+        mock_llm_factory.create.return_value = MagicMock()
+
+        mock_embedder = MagicMock()
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3] for _ in texts]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+
+        with patch.object(memory, '_extract_facts', return_value=["likes tea", "likes tea", "lives in Paris"]), \
+                patch.object(memory, '_decide_memory_actions', return_value=[]) as mock_decide:
+            memory.add("I like tea. I like tea. I live in Paris.", user_id="test_user")
+
+        mock_embedder.embed_batch.assert_called_once_with(["likes tea", "lives in Paris"], memory_action="add")
+        assert mock_decide.call_args[0][0] == ["likes tea", "lives in Paris"]
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_intelligent_add_searches_facts_concurrently_in_order(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Per-fact similarity searches keep fact order when run concurrently."""
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[0.1, 0.2, 0.3] for _ in texts]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        facts = [f"fact {i}" for i in range(5)]
+        memory.storage.vector_store.search = MagicMock(
+            side_effect=lambda **kwargs: [
+                {"id": int(kwargs["query"].split()[1]) + 1, "data": kwargs["query"], "score": 0.9}
+            ]
+        )
+
+        with patch.object(memory, '_extract_facts', return_value=facts), \
+                patch.object(memory, '_decide_memory_actions', return_value=[]) as mock_decide:
+            memory.add("five facts", user_id="test_user")
+
+        assert memory.storage.vector_store.search.call_count == 5
+        assert [m["memory"] for m in mock_decide.call_args[0][1]] == facts
+
     @patch('powermem.core.memory.VectorStoreFactory')
     @patch('powermem.core.memory.LLMFactory')
     @patch('powermem.core.memory.EmbedderFactory')
@@ -92,6 +223,82 @@ class TestMemory:
             assert isinstance(results, dict)
             assert "results" in results
     
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_search_cache_serves_repeats_until_write(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Repeated searches hit the result cache; a write through the adapter invalidates it."""
+        mock_vector_store = MagicMock()
+        mock_vector_factory.create.return_value = mock_vector_store
+        mock_llm_factory.create.return_value = MagicMock()
+
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory(config={"performance": {"search_cache_size": 10, "embedding_cache_size": 0}})
+
+        with patch.object(memory.storage, 'search_memories', return_value=[]) as mock_search:
+            first = memory.search("user preferences", user_id="test_user")
+            first["results"].append("mutated by caller")
+            second = memory.search("user preferences", user_id="test_user")
+            assert mock_search.call_count == 1
+            assert second == {"results": []}
+
+            memory.search("user preferences", user_id="other_user")
+            assert mock_search.call_count == 2
+
+            memory.delete("test_id", user_id="test_user")
+            memory.search("user preferences", user_id="test_user")
+            assert mock_search.call_count == 3
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_search_cache_invalidated_by_reset_and_access_tracking(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """reset() and access-count updates from get() drop cached search results."""
+        mock_vector_store = MagicMock()
+        mock_vector_factory.create.return_value = mock_vector_store
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder_factory.create.return_value = MagicMock()
+
+        memory = Memory(config={"performance": {"search_cache_size": 10, "embedding_cache_size": 0}})
+
+        with patch.object(memory.storage, 'search_memories', return_value=[]) as mock_search:
+            memory.search("user preferences", user_id="test_user")
+            memory.reset()
+            memory.search("user preferences", user_id="test_user")
+            assert mock_search.call_count == 2
+
+        # Keep the plugin's background lifecycle updates out of the way
+        memory._intelligence_plugin = None
+        hit = {"id": 1, "memory": "likes tea", "metadata": {"metadata": {"access_count": 1}}}
+        with patch.object(memory.storage, 'search_memories', return_value=[hit]) as mock_search, \
+             patch.object(memory.storage, 'get_memory', return_value={"id": 1, "metadata": {"metadata": {}}}):
+            memory.search("tea", user_id="test_user")
+            memory.search("tea", user_id="test_user")
+            assert mock_search.call_count == 1
+
+            memory.get(1, user_id="test_user")
+            memory.search("tea", user_id="test_user")
+            assert mock_search.call_count == 2
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_llm_cache_is_opt_in(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """The LLM is only wrapped in the response cache when performance.llm_cache_size > 0."""
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm = MagicMock()
+        mock_llm_factory.create.return_value = mock_llm
+        mock_embedder_factory.create.return_value = MagicMock()
+
+        assert Memory(config={}).llm is mock_llm
+
+        cached = Memory(config={"performance": {"llm_cache_size": 8}}).llm
+        assert isinstance(cached, CachedLLM)
+        assert cached.llm is mock_llm
+
     @patch('powermem.core.memory.VectorStoreFactory')
     @patch('powermem.core.memory.LLMFactory')
     @patch('powermem.core.memory.EmbedderFactory')
@@ -153,6 +360,125 @@ class TestMemory:
             assert isinstance(updated, dict)
             assert updated["id"] == "test_id"
     
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_update_without_metadata_skips_prefetch(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Without sub stores or plugin, update leaves the existence check and metadata merge to storage."""
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        memory._intelligence_plugin = None
+
+        with patch.object(memory.storage, 'get_memory') as mock_get, \
+             patch.object(memory.storage, 'update_memory', return_value={"id": "test_id"}) as mock_update:
+            memory.update("test_id", "Updated content", user_id="test_user")
+
+        mock_get.assert_not_called()
+        update_data = mock_update.call_args[0][1]
+        assert "metadata" not in update_data
+        assert update_data["content"] == "Updated content"
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_update_without_metadata_scores_stored_metadata(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Without new metadata, the plugin's on_add sees the memory's stored metadata."""
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder_factory.create.return_value = MagicMock()
+
+        memory = Memory()
+        plugin = MagicMock(enabled=True)
+        plugin.on_add.return_value = {}
+        memory._intelligence_plugin = plugin
+        stored = {"id": "test_id", "metadata": {"priority": "high", "tags": ["work"]}}
+
+        with patch.object(memory.storage, 'get_memory', return_value=stored), \
+             patch.object(memory.storage, 'update_memory', return_value={"id": "test_id"}):
+            memory.update("test_id", "Updated content", user_id="test_user")
+
+        plugin.on_add.assert_called_once_with(
+            content="Updated content", metadata={"priority": "high", "tags": ["work"]}
+        )
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_update_with_unchanged_content_skips_embedding(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """An update whose content hash matches the stored hash keeps the stored vector, even without owner IDs."""
+        from powermem.utils.utils import generate_content_hash
+
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed.return_value = [0.1, 0.2, 0.3]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory()
+        memory._intelligence_plugin = None
+        stored_hash = generate_content_hash("Same content", "test_user", memory.agent_id)
+
+        stored = (stored_hash, "test_user", memory.agent_id)
+
+        with patch.object(memory.storage, 'get_memory_hash_and_owner', return_value=stored), \
+             patch.object(memory.storage, 'update_memory', return_value={"id": "test_id"}) as mock_update:
+            memory.update("test_id", "Same content", metadata={"k": "v"})
+            memory._update_memory("test_id", "Same content")
+
+        mock_embedder.embed.assert_not_called()
+        update_data = mock_update.call_args_list[0][0][1]
+        assert "embedding" not in update_data
+        assert update_data["metadata"] == {"k": "v"}
+        assert set(mock_update.call_args_list[1][0][1]) == {"updated_at"}
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_update_many_batches_embeddings_and_storage(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """update_many embeds all contents in one call and writes through one storage batch."""
+        from powermem.utils.utils import generate_content_hash
+
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder = MagicMock()
+        mock_embedder.embed_batch.side_effect = lambda texts, **kwargs: [[float(len(t))] for t in texts]
+        mock_embedder_factory.create.return_value = mock_embedder
+
+        memory = Memory(config={"performance": {"embedding_cache_size": 0}})
+        memory._intelligence_plugin = None
+
+        with patch.object(memory.storage, 'update_memories', return_value=[{"id": 1}, None]) as mock_update, \
+             patch.object(memory.storage, 'get_memory_hash_and_owner', return_value=("old", "test_user", "owner_agent")), \
+             patch.object(memory.audit, 'log_event') as mock_audit:
+            results = memory.update_many(
+                [
+                    {"memory_id": 1, "content": "a", "metadata": {"category": "pref", "k": "v"}},
+                    {"memory_id": 2, "content": "bbb"},
+                ],
+                user_id="test_user",
+            )
+
+        assert results == [{"id": 1}, None]
+        mock_embedder.embed_batch.assert_called_once()
+        mock_embedder.embed.assert_not_called()
+        batch, user_id, _ = mock_update.call_args[0]
+        assert user_id == "test_user"
+        assert [memory_id for memory_id, _ in batch] == [1, 2]
+        assert batch[0][1]["embedding"] == [1.0]
+        assert batch[0][1]["category"] == "pref"
+        assert batch[0][1]["metadata"] == {"k": "v"}
+        assert batch[1][1]["embedding"] == [3.0]
+        assert "metadata" not in batch[1][1]
+        # Hashed with the stored owner, not the caller's (unset) agent_id
+        assert batch[1][1]["hash"] == generate_content_hash("bbb", "test_user", "owner_agent")
+        mock_audit.assert_called_once()
+        assert mock_audit.call_args[0][1]["updated_count"] == 1
+
     @patch('powermem.core.memory.VectorStoreFactory')
     @patch('powermem.core.memory.LLMFactory')
     @patch('powermem.core.memory.EmbedderFactory')
@@ -176,6 +502,65 @@ class TestMemory:
             deleted = memory.delete("test_id", user_id="test_user")
             
             assert deleted is True
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_migrate_all_sub_stores_runs_in_parallel(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Sub stores migrate concurrently; a failing store reports 0 without affecting the others."""
+        import threading
+
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder_factory.create.return_value = MagicMock()
+
+        memory = Memory()
+        memory.sub_stores_config = [
+            {"name": name, "routing_filter": {"tier": name}} for name in ("a", "b", "c")
+        ]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_migrate(index, delete_source):
+            if index == 1:
+                raise RuntimeError("boom")
+            # Stores 0 and 2 can only both pass the barrier when run concurrently
+            barrier.wait()
+            return index + 10
+
+        with patch.object(memory, '_is_embedded_store', return_value=False), \
+             patch.object(memory, 'migrate_to_sub_store', side_effect=fake_migrate):
+            results = memory.migrate_all_sub_stores()
+
+        assert results == {"a": 10, "b": 0, "c": 12}
+
+    @patch('powermem.core.memory.VectorStoreFactory')
+    @patch('powermem.core.memory.LLMFactory')
+    @patch('powermem.core.memory.EmbedderFactory')
+    def test_migrate_all_sub_stores_overlapping_filters_run_sequentially(self, mock_embedder_factory, mock_llm_factory, mock_vector_factory):
+        """Sub stores whose routing filters can match the same record are migrated one at a time."""
+        import threading
+
+        mock_vector_factory.create.return_value = MagicMock()
+        mock_llm_factory.create.return_value = MagicMock()
+        mock_embedder_factory.create.return_value = MagicMock()
+
+        memory = Memory()
+        memory.sub_stores_config = [
+            {"name": "a", "routing_filter": {"tier": "hot"}},
+            {"name": "b", "routing_filter": {"region": "eu"}},
+        ]
+        threads = []
+
+        def fake_migrate(index, delete_source):
+            threads.append(threading.current_thread())
+            return index
+
+        with patch.object(memory, '_is_embedded_store', return_value=False), \
+             patch.object(memory, 'migrate_to_sub_store', side_effect=fake_migrate):
+            results = memory.migrate_all_sub_stores()
+
+        assert results == {"a": 0, "b": 1}
+        assert threads == [threading.current_thread()] * 2
     
     @patch('powermem.core.memory.VectorStoreFactory')
     @patch('powermem.core.memory.LLMFactory')
@@ -215,3 +600,19 @@ class TestMemory:
             assert isinstance(results, dict)
             assert "results" in results
             assert len(results["results"]) == 0
+
+
+def test_split_category_copies_metadata_only_when_needed():
+    metadata = {"topic": "tea"}
+    assert _split_category(metadata) == ("", metadata)
+    assert _split_category(metadata)[1] is metadata
+    assert _split_category(None) == ("", None)
+
+    category, merged = _split_category({"topic": "tea", "category": "pref"}, {"importance": 0.5})
+    assert category == "pref"
+    assert merged == {"topic": "tea", "importance": 0.5}
+
+    _, merged = _split_category(metadata, {"importance": 0.5})
+    assert merged == {"topic": "tea", "importance": 0.5}
+    assert metadata == {"topic": "tea"}
+    assert _split_category(None, {"importance": 0.5}) == ("", {"importance": 0.5})
@@ -0,0 +1,16 @@
+from powermem.utils.oceanbase_util import OceanBaseUtil
+
+
+def test_normalize_batch_matches_per_vector_normalize():
+    vectors = [[3.0, 4.0, 0.0], [0.0, 0.0, 0.0], [1.0, 2.0, 2.0]]
+
+    normalized = OceanBaseUtil.normalize_batch(vectors)
+
+    assert normalized == [OceanBaseUtil.normalize(vector) for vector in vectors]
+    assert normalized[1] == [0.0, 0.0, 0.0]
+
+
+def test_normalize_batch_handles_ragged_input():
+    vectors = [[3.0, 4.0], [1.0]]
+
+    assert OceanBaseUtil.normalize_batch(vectors) == [[0.6, 0.8], [1.0]]
@@ -206,3 +206,27 @@ def test_callback_with_tools(mock_openai_client):
     mock_callback.assert_called_once()
     # Check that tool_calls exists in the message
     assert hasattr(mock_callback.call_args[0][1].choices[0].message, 'tool_calls')
+
+
+def test_openai_llm_converts_base_config():
+    from powermem.integrations.llm.config.base import BaseLLMConfig
+
+    base = BaseLLMConfig(model="gpt-4o-mini", temperature=0.2, api_key="api_key", max_tokens=64, top_k=5)
+    llm = OpenAILLM(base)
+
+    assert isinstance(llm.config, OpenAIConfig)
+    assert (llm.config.model, llm.config.temperature, llm.config.max_tokens, llm.config.top_k) == (
+        "gpt-4o-mini", 0.2, 64, 5
+    )
+
+
+def test_openrouter_mode_is_fixed_at_construction(mock_openai_client, monkeypatch):
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    llm = OpenAILLM(OpenAIConfig(model="gpt-4o", temperature=0.7, max_tokens=100, top_p=1.0))
+    mock_openai_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content="ok"))])
+
+    # Setting the variable later must not switch request params away from the OpenAI client
+    monkeypatch.setenv("OPENROUTER_API_KEY", "router-key")
+    llm.generate_response([{"role": "user", "content": "hi"}])
+
+    assert mock_openai_client.chat.completions.create.call_args.kwargs["store"] is False
@@ -0,0 +1,29 @@
+"""Unit tests for OpenAIEmbedding.embed_batch request chunking."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import powermem.integrations.embeddings.openai as openai_embedding
+from powermem.integrations.embeddings.config.base import BaseEmbedderConfig
+
+
+def _fake_create(**kwargs):
+    texts = kwargs["input"]
+    # Return items out of order to check the index sort
+    data = [SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(texts)]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+def test_embed_batch_splits_requests_and_keeps_order():
+    with patch.object(openai_embedding, "OpenAI") as mock_openai, \
+         patch.object(openai_embedding, "MAX_INPUTS_PER_REQUEST", 2):
+        client = MagicMock()
+        client.embeddings.create.side_effect = _fake_create
+        mock_openai.return_value = client
+
+        embedder = openai_embedding.OpenAIEmbedding(BaseEmbedderConfig(api_key="test"))
+        vectors = embedder.embed_batch(["a", "bb", "ccc", "dd\nd", "e"])
+
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [1.0]]
+    assert client.embeddings.create.call_count == 3
+    assert client.embeddings.create.call_args_list[1].kwargs["input"] == ["ccc", "dd d"]
@@ -383,4 +383,33 @@ def test_config_conversion_from_dict():
     assert llm.config.model == "qwen-plus"
     assert llm.config.temperature == 0.5
     assert llm.config.api_key == "test_key"
-    assert llm.config.max_tokens == 1500
\ No newline at end of file
+    assert llm.config.max_tokens == 1500
+
+
+def test_generate_response_with_message_tool_calls(mock_dashscope_generation):
+    config = QwenConfig(model="qwen-turbo", temperature=0.7, max_tokens=100, top_p=1.0, api_key="test_key")
+    llm = QwenLLM(config)
+    tools = [{"type": "function", "function": {"name": "add_memory"}}]
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.output = {
+        "choices": [
+            {
+                "message": {
+                    "content": "Added.",
+                    "tool_calls": [
+                        {"function": {"name": "add_memory", "arguments": '{"data": "Today is a sunny day."}'}}
+                    ],
+                }
+            }
+        ]
+    }
+    mock_dashscope_generation.call.return_value = mock_response
+
+    response = llm.generate_response([{"role": "user", "content": "Add a memory"}], tools=tools)
+
+    assert response == {
+        "content": "Added.",
+        "tool_calls": [{"name": "add_memory", "arguments": {"data": "Today is a sunny day."}}],
+    }
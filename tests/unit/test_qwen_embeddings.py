@@ -1,3 +1,4 @@
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -322,3 +323,40 @@ def test_multimodal_config_none_auto_detect():
     config_no_field = BaseEmbedderConfig(model="qwen3-vl-embedding", api_key="test_key")
     embedder_no_field = QwenEmbedding(config_no_field)
     assert embedder_no_field._is_vl_model() is True
+
+
+def test_embed_batch_chunks_requests_and_keeps_input_order(mock_dashscope):
+    embedder = QwenEmbedding(BaseEmbedderConfig(api_key="test_key"))
+
+    def fake_call(api_key, input, **params):
+        response = Mock()
+        response.status_code = 200
+        # DashScope may return items out of order; text_index maps them back
+        response.output = {
+            'embeddings': [
+                {'text_index': i, 'embedding': [float(text.split()[1])]}
+                for i, text in reversed(list(enumerate(input)))
+            ]
+        }
+        return response
+
+    mock_dashscope.call.side_effect = fake_call
+    texts = [f"text {i}\n" for i in range(12)]
+
+    result = embedder.embed_batch(texts, memory_action="search")
+
+    assert result == [[float(i)] for i in range(12)]
+    assert [len(call.kwargs["input"]) for call in mock_dashscope.call.call_args_list] == [10, 2]
+    assert mock_dashscope.call.call_args.kwargs["text_type"] == "query"
+    assert mock_dashscope.call.call_args.kwargs["input"] == ["text 10", "text 11"]
+
+
+def test_base_url_is_set_on_sdk_without_touching_environ(mock_dashscope, monkeypatch):
+    monkeypatch.delenv("DASHSCOPE_BASE_URL", raising=False)
+    monkeypatch.setattr("powermem.integrations.embeddings.qwen.dashscope", Mock())
+    from powermem.integrations.embeddings import qwen
+
+    QwenEmbedding(BaseEmbedderConfig(api_key="test_key", dashscope_base_url="https://example.com/api/v1"))
+
+    assert qwen.dashscope.base_http_api_url == "https://example.com/api/v1"
+    assert "DASHSCOPE_BASE_URL" not in os.environ
@@ -0,0 +1,35 @@
+"""Tests for the cached user ID lookup in powermem.core.setup."""
+
+import json
+
+import pytest
+
+from powermem.core import setup
+
+
+@pytest.fixture
+def powermem_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(setup, "powermem_dir", tmp_path)
+    setup._load_user_id.cache_clear()
+    yield tmp_path
+    setup._load_user_id.cache_clear()
+
+
+def test_get_user_id_creates_config_and_reads_it_once(powermem_dir, monkeypatch):
+    user_id = setup.get_user_id()
+    stored = json.loads((powermem_dir / "config.json").read_text())
+    assert stored["user_id"] == user_id
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("config.json re-read")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    assert setup.get_user_id() == user_id
+
+
+def test_get_user_id_does_not_cache_failures(powermem_dir):
+    (powermem_dir / "config.json").write_text("not json")
+    assert setup.get_user_id() == "anonymous_user"
+
+    (powermem_dir / "config.json").write_text(json.dumps({"user_id": "u-123"}))
+    assert setup.get_user_id() == "u-123"